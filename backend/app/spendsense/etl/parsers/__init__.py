@@ -1,34 +1,68 @@
 from __future__ import annotations
 
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
 
 from .common import SpendSenseParseError
 from .excel_parser import parse_excel_file
-from .pdf_parser import parse_pdf_file
+from .pdf_parser import _in_worker_process, parse_pdf_file
 from .email_parser import parse_email_payload
 
+logger = logging.getLogger(__name__)
+
 
 def parse_transactions_file(
     data: bytes,
     filename: str,
     pdf_password: str | None = None,
+    *,
+    pdf_page_workers: int = 1,
 ) -> list[dict[str, Any]]:
     """
     Dispatch parsing based on file extension.
     Supports CSV/XLS/XLSX, PDF, and (future) email sources.
+    pdf_page_workers > 1 opts single-threaded callers (CLI scripts) into per-page PDF worker processes.
     """
     ext = Path(filename).suffix.lower()
 
     if ext in {".csv", ".xls", ".xlsx"}:
         return parse_excel_file(data, filename)
     if ext == ".pdf":
-        return parse_pdf_file(data, filename, pdf_password)
+        return parse_pdf_file(data, filename, pdf_password, page_workers=pdf_page_workers)
     if ext in {".eml", ".msg"}:
         return parse_email_payload(data, filename, pdf_password=pdf_password)
 
     raise SpendSenseParseError(f"Unsupported file extension: {ext}")
 
 
-__all__ = ["parse_transactions_file", "SpendSenseParseError"]
+def _parse_one(item: tuple[bytes, str]) -> list[dict[str, Any]]:
+    data, filename = item
+    return parse_transactions_file(data, filename)
+
+
+def parse_files_bulk(
+    inputs: list[tuple[bytes, str]],
+    max_workers: int | None = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Parse several (data, filename) uploads across worker processes.
+    Results are returned in input order; the first parse error is re-raised.
+    Parsing is CPU-bound regex/pandas work, so processes (not threads) are used. Inside a daemon or
+    pool worker (e.g. a Celery prefork task), which may not start children, the inputs are parsed serially.
+    """
+    workers = min(len(inputs), max_workers or os.cpu_count() or 1)
+    if workers > 1 and not _in_worker_process():
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_parse_one, inputs))
+        except (BrokenProcessPool, OSError) as exc:
+            logger.warning("Parallel parsing unavailable, parsing %d files serially: %s", len(inputs), exc)
+    return [_parse_one(item) for item in inputs]
+
+
+__all__ = ["parse_transactions_file", "parse_files_bulk", "SpendSenseParseError"]
 
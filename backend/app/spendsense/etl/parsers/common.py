@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import io
 import logging
 import re
+from datetime import datetime
 from typing import Any
 
 import pandas as pd  # type: ignore[import-untyped]
 
+try:
+    import pyarrow as pa  # type: ignore[import-untyped]
+    import pyarrow.compute as pc  # type: ignore[import-untyped]
+except ImportError:
+    pa = None  # type: ignore[assignment]
+    pc = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -192,6 +201,26 @@ def infer_bank_code(filename: str, sample_text: str | None = None) -> str | None
     return None
 
 
+def _sample_text(df_raw: pd.DataFrame, rows: int = 5) -> str:
+    """Flatten the first rows of a raw sheet into one string for bank-keyword sniffing."""
+    if pa is not None and len(df_raw.columns) and all(isinstance(dt, pd.ArrowDtype) for dt in df_raw.dtypes):
+        try:
+            return _sample_text_arrow(df_raw, rows)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+    buf = io.StringIO()
+    df_raw.head(rows).to_csv(buf, sep=" ", header=False, index=False)
+    return buf.getvalue()
+
+
+def _sample_text_arrow(df_raw: pd.DataFrame, rows: int = 5) -> str:
+    """Arrow-backed variant of _sample_text: join cells with pyarrow.compute instead of the CSV writer."""
+    head = df_raw.head(rows)
+    cols = [pc.cast(pa.array(head[col]), pa.string()) for col in head.columns]
+    joined = pc.binary_join_element_wise(*cols, " ", null_handling="replace")
+    return "\n".join(joined.to_pylist())
+
+
 def detect_channel(description: str | None, direction: str | None) -> str:
     text = (description or "").upper()
     for channel, keywords in CHANNEL_KEYWORDS:
@@ -247,6 +276,21 @@ def _parse_amount_value(value: Any) -> float | None:
         return None
 
 
+_NO_COMMA = str.maketrans("", "", ",")
+# Line parsers skip amount regexes on ASCII lines with none of these (non-ASCII lines may hold other \d digits)
+_ASCII_DIGITS = frozenset("0123456789")
+
+
+def _parse_ddmmyyyy(s: str) -> datetime | None:
+    """Parse DD-MM-YYYY by slicing; no regex or strptime format parsing."""
+    if len(s) != 10 or s[2] != "-" or s[5] != "-" or not (s[:2] + s[3:5] + s[6:]).isdigit():
+        return None
+    try:
+        return datetime(int(s[6:10]), int(s[3:5]), int(s[0:2]))
+    except ValueError:
+        return None
+
+
 def _collapse_pdf_continuation_rows(df: pd.DataFrame) -> pd.DataFrame:
     """Merge PDF rows where descriptions wrap onto subsequent rows.
 
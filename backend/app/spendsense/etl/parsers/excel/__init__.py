@@ -1,6 +1,6 @@
 """Excel/CSV bank statement parsers - one module per bank for easy maintenance."""
 
-from .base import read_spreadsheet
+from .base import read_spreadsheet, read_spreadsheets
 from .icici import parse_icici_excel
 from .hdfc import parse_hdfc_excel
 from .sbi import parse_sbi_excel
@@ -15,6 +15,7 @@ BANK_EXCEL_PARSERS = [
 
 __all__ = [
     "read_spreadsheet",
+    "read_spreadsheets",
     "parse_icici_excel",
     "parse_hdfc_excel",
     "parse_sbi_excel",
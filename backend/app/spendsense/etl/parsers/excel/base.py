@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd  # type: ignore[import-untyped]
@@ -15,6 +16,22 @@ except Exception:
     class XLRDError(Exception):  # type: ignore
         pass
 
+# Optional fast readers (pip install ".[fast-io]"); fall back to pandas' C / openpyxl engines without them
+try:
+    import pyarrow  # type: ignore[import-untyped]  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import python_calamine  # type: ignore[import-untyped]  # noqa: F401
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+# XLSX is a ZIP container; legacy XLS is an OLE2 compound document
+_EXCEL_MAGIC = (b"PK\x03\x04", b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1")
+
 
 def read_spreadsheet(data: bytes, filename: str) -> pd.DataFrame:
     """Read CSV/XLS/XLSX file into a raw DataFrame with no header assumed."""
@@ -22,21 +39,64 @@ def read_spreadsheet(data: bytes, filename: str) -> pd.DataFrame:
     buffer = io.BytesIO(data)
 
     if ext == ".csv":
-        buffer.seek(0)
-        return pd.read_csv(buffer, header=None, keep_default_na=False)
+        return _read_csv(buffer)
     if ext in {".xls", ".xlsx"}:
+        # Misnamed text exports skip straight to the text fallback instead of a doomed xlrd/openpyxl parse.
+        # Either signature is accepted for either extension since pandas picks the engine from the content.
+        if data.startswith(_EXCEL_MAGIC):
+            try:
+                return _read_excel(buffer, ext)
+            except (ValueError, UnicodeDecodeError, XLRDError):
+                pass
+        df = _read_text_like_spreadsheet(data)
+        if df is None:
+            raise SpendSenseParseError(
+                f"Unable to read spreadsheet contents from {filename}. "
+                "Please upload a valid Excel/CSV export."
+            )
+        return df
+    raise SpendSenseParseError(f"Unsupported Excel extension: {ext}")
+
+
+def read_spreadsheets(files: list[tuple[bytes, str]], max_workers: int = 8) -> list[pd.DataFrame]:
+    """Read several (data, filename) spreadsheets concurrently, in input order.
+
+    Threads are enough here: the C/pyarrow CSV readers and calamine release the GIL while parsing,
+    and read_spreadsheet keeps no shared state.
+    """
+    if len(files) <= 1:
+        return [read_spreadsheet(data, filename) for data, filename in files]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as pool:
+        return list(pool.map(lambda f: read_spreadsheet(*f), files))
+
+
+def _read_csv(buffer: io.BytesIO) -> pd.DataFrame:
+    """Read CSV with the pyarrow engine when available, else pandas' C engine."""
+    # Columns are deliberately left untyped: bank exports carry text preamble rows above the header, so a
+    # sniff of the first rows would classify every column as text anyway, and the bank parsers match on the
+    # cells' original text. With pyarrow, text is stored as Arrow strings rather than Python object arrays.
+    if HAS_PYARROW:
+        try:
+            df = pd.read_csv(buffer, header=None, keep_default_na=False, engine="pyarrow", dtype_backend="pyarrow")
+            # Non-UTF-8 text comes back as binary columns; the C engine raises UnicodeDecodeError instead
+            if not any(str(dtype).startswith("binary") for dtype in df.dtypes):
+                return df
+        except ValueError:
+            # ArrowInvalid (ragged rows etc.) - let the C engine decide / raise as before
+            pass
         buffer.seek(0)
+    return pd.read_csv(buffer, header=None, keep_default_na=False, engine="c")
+
+
+def _read_excel(buffer: io.BytesIO, ext: str) -> pd.DataFrame:
+    """Read XLSX with calamine when available (much faster than openpyxl); XLS stays on xlrd."""
+    if ext == ".xlsx" and HAS_CALAMINE:
         try:
-            return pd.read_excel(buffer, header=None, keep_default_na=False)
-        except (ValueError, UnicodeDecodeError, XLRDError):
-            df = _read_text_like_spreadsheet(data)
-            if df is None:
-                raise SpendSenseParseError(
-                    f"Unable to read spreadsheet contents from {filename}. "
-                    "Please upload a valid Excel/CSV export."
-                )
-            return df
-    raise SpendSenseParseError(f"Unsupported Excel extension: {ext}")
+            return pd.read_excel(buffer, header=None, keep_default_na=False, engine="calamine")
+        except Exception:
+            # CalamineError is not a ValueError; re-read with openpyxl so callers see the usual errors
+            buffer.seek(0)
+    return pd.read_excel(buffer, header=None, keep_default_na=False)
 
 
 def _read_text_like_spreadsheet(data: bytes) -> pd.DataFrame | None:
@@ -60,9 +120,8 @@ def _read_text_like_spreadsheet(data: bytes) -> pd.DataFrame | None:
     if not rows:
         return None
 
-    max_cols = max(len(row) for row in rows)
-    normalized = [row + [""] * (max_cols - len(row)) for row in rows]
-    return pd.DataFrame(normalized)
+    # pandas pads ragged rows with None; fillna turns the padding into the empty cells callers expect
+    return pd.DataFrame(rows).fillna("")
 
 
 def _decode_bytes(data: bytes) -> str:
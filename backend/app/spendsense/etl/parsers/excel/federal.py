@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import pandas as pd  # type: ignore[import-untyped]
 
-from ..common import dataframe_to_records, infer_bank_code, structure_dataframe
+from ..common import _sample_text, dataframe_to_records, infer_bank_code, structure_dataframe
 
 
 def parse_federal_excel(df_raw: pd.DataFrame, filename: str) -> list[dict]:
     """Parse Federal bank Excel/CSV statement. Uses generic structure detection."""
-    sample_text = " ".join(df_raw.head(5).astype(str).values.ravel().tolist())
+    sample_text = _sample_text(df_raw)
     bank_code = infer_bank_code(filename, sample_text) or "federal_bank"
     df = structure_dataframe(df_raw, is_pdf=False)
     return dataframe_to_records(df, bank_code=bank_code)
@@ -1,5 +1,8 @@
 """PDF bank statement parsers - one module per bank for easy maintenance."""
 
+import re
+
+from . import axis, canara, federal, hdfc, icici, kotak, sbi
 from .icici import parse_icici_pdf
 from .hdfc import parse_hdfc_pdf
 from .kotak import parse_kotak_pdf
@@ -18,4 +21,17 @@ BANK_PARSERS = [
     ("Canara", parse_canara_pdf),
 ]
 
-__all__ = ["parse_icici_pdf", "parse_hdfc_pdf", "parse_kotak_pdf", "parse_federal_pdf", "parse_axis_pdf", "parse_sbi_pdf", "parse_canara_pdf", "BANK_PARSERS"]
+# Bank-name keywords each parser requires in its lowered header window (at most detect.HINT_LINES lines),
+# taken from the parser modules. If none occurs in bank_hint(lines), that parser would return None,
+# so the fallback loop can skip it.
+BANK_SIGNATURES: dict[str, re.Pattern[str]] = {
+    "Kotak": kotak.SIGNATURE,
+    "HDFC": hdfc.SIGNATURE,
+    "ICICI": icici.SIGNATURE,
+    "Federal": federal.SIGNATURE,
+    "Axis": axis.SIGNATURE,
+    "SBI": sbi.SIGNATURE,
+    "Canara": canara.SIGNATURE,
+}
+
+__all__ = ["parse_icici_pdf", "parse_hdfc_pdf", "parse_kotak_pdf", "parse_federal_pdf", "parse_axis_pdf", "parse_sbi_pdf", "parse_canara_pdf", "BANK_PARSERS", "BANK_SIGNATURES"]
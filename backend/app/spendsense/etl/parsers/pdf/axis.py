@@ -14,88 +14,109 @@ Supports:
 
 from __future__ import annotations
 
+import functools
 import re
-from datetime import datetime
-from typing import Any
+from datetime import date, datetime
 
 import pandas as pd  # type: ignore[import-untyped]
 
+from ..common import _NO_COMMA, _parse_ddmmyyyy
+from .detect import any_contains_ci, header_text
+
+# Bank names this parser requires in its lowered header window (pdf.BANK_SIGNATURES reuses it)
+_BANK_NAMES = ("axis",)
+SIGNATURE = re.compile("|".join(_BANK_NAMES))
+
 MONTH_TO_NUM = {
     "jan": "01", "feb": "02", "mar": "03", "apr": "04", "may": "05", "jun": "06",
     "jul": "07", "aug": "08", "sep": "09", "oct": "10", "nov": "11", "dec": "12",
 }
 
+_AXIS_DATE_PREFIX_RE = re.compile(r"^\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)", re.I)
+
+# Pattern 1: Date at start - "24 Jan '26 EMI Interest ... ₹ 2,528.05 Debit"
+_PAT_DATE_FIRST = re.compile(
+    r"^(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+'\d{2})\s+(.+?)\s+₹\s+([\d,]+\.\d{2})\s+(Debit|Credit)\s*$",
+    re.I,
+)
+# Pattern 2: Date in middle - "BBPS Payment Received - 03 Jan '26 ₹ 19,089.74 Credit"
+_PAT_DATE_MID = re.compile(
+    r"^(.+?)\s+(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+'\d{2})\s+₹\s+([\d,]+\.\d{2})\s+(Debit|Credit)\s*$",
+    re.I,
+)
+# Pattern 3: Date-only (description on previous line) - "03 Jan '26 ₹ 19,089.74 Credit"
+_PAT_DATE_ONLY = re.compile(
+    r"^(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+'\d{2})\s+₹\s+([\d,]+\.\d{2})\s+(Debit|Credit)\s*$",
+    re.I,
+)
+# Header/footer/summary lines in credit card statements (one alternation, anchored via .match)
+_SKIP_RE = re.compile(
+    r"Date\s+Transaction\s+Details\s+Amount"
+    r"|(?-i:\*\*End of Transaction Summary\*\*)"
+    r"|(?-i:\*\*End of Active Loans Summary\*\*)"
+    r"|Page\s+\d+\s+of\s+\d+"
+    r"|View Active Loans"
+    r"|Payment Summary"
+    r"|Transaction Summary"
+    r"|Active Loans Summary"
+    r"|S\.No\s+Loan Type"
+    r"|Total\s+Remaining",
+    re.I,
+)
+
 
+@functools.lru_cache(maxsize=1024)
 def _parse_axis_date(date_str: str) -> datetime | None:
     """Parse Axis date format: DD MMM 'YY (e.g. 24 Jan '26)."""
-    m = re.match(r"^(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+'(\d{2})\s*$", date_str, re.I)
-    if not m:
+    parts = date_str.split()
+    if len(parts) != 3:
         return None
-    day, month_name, yy = m.group(1), m.group(2).lower()[:3], m.group(3)
-    month = MONTH_TO_NUM.get(month_name)
+    day_s, mon_s, yy_s = parts
+    if len(day_s) > 2 or not day_s.isdigit() or len(yy_s) != 3 or yy_s[0] != "'" or not yy_s[1:].isdigit():
+        return None
+    month = MONTH_TO_NUM.get(mon_s.lower())
     if not month:
         return None
-    year = 2000 + int(yy)
     try:
-        return datetime(year, int(month), int(day))
+        return datetime(2000 + int(yy_s[1:]), int(month), int(day_s))
     except ValueError:
         return None
 
 
-def parse_axis_pdf(lines: list[str]) -> pd.DataFrame | None:
+def parse_axis_pdf(lines: list[str], hint: str | None = None) -> pd.DataFrame | None:
     """Parse Axis Bank PDF statements (credit card or savings)."""
     if not lines:
         return None
 
-    haystack = " ".join(lines[:80]).lower()
-    if "axis" not in haystack and "axis bank" not in haystack:
+    # Without a shared hint, bail out line by line before building the joined window
+    if hint is None and not any_contains_ci(lines[:80], *_BANK_NAMES):
+        return None
+
+    # Phrase checks can span line breaks, so they still need the joined window
+    haystack = header_text(lines, 80, hint)
+    if not SIGNATURE.search(haystack):
         return None
 
     # Try savings format first (Statement of Axis Account, Tran Date, Debit Credit Balance)
     if "statement of axis account" in haystack or "tran date" in haystack:
-        df = parse_axis_savings_pdf(lines)
+        df = parse_axis_savings_pdf(lines, hint)
         if df is not None and not df.empty:
             return df
 
     if "transaction" not in haystack and "debit" not in haystack and "credit" not in haystack:
         return None
 
-    # Pattern 1: Date at start - "24 Jan '26 EMI Interest ... ₹ 2,528.05 Debit"
-    pattern_date_first = re.compile(
-        r"^(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+'\d{2})\s+(.+?)\s+₹\s+([\d,]+\.\d{2})\s+(Debit|Credit)\s*$",
-        re.I,
-    )
-    # Pattern 2: Date in middle - "BBPS Payment Received - 03 Jan '26 ₹ 19,089.74 Credit"
-    pattern_date_mid = re.compile(
-        r"^(.+?)\s+(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+'\d{2})\s+₹\s+([\d,]+\.\d{2})\s+(Debit|Credit)\s*$",
-        re.I,
-    )
-    # Pattern 3: Date-only (description on previous line) - "03 Jan '26 ₹ 19,089.74 Credit"
-    pattern_date_only = re.compile(
-        r"^(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+'\d{2})\s+₹\s+([\d,]+\.\d{2})\s+(Debit|Credit)\s*$",
-        re.I,
-    )
-
-    def _skip_line(s: str) -> bool:
-        return bool(
-            re.match(r"^Date\s+Transaction\s+Details\s+Amount", s, re.I)
-            or re.match(r"^\*\*End of Transaction Summary\*\*", s)
-            or re.match(r"^\*\*End of Active Loans Summary\*\*", s)
-            or re.match(r"^Page\s+\d+\s+of\s+\d+", s, re.I)
-            or re.match(r"^View Active Loans", s, re.I)
-            or re.match(r"^Payment Summary", s, re.I)
-            or re.match(r"^Transaction Summary", s, re.I)
-            or re.match(r"^Active Loans Summary", s, re.I)
-            or re.match(r"^S\.No\s+Loan Type", s, re.I)
-            or re.match(r"^Total\s+Remaining", s, re.I)
-        )
-
-    parsed_rows: list[dict[str, Any]] = []
+    txn_dates: list[date] = []
+    descriptions: list[str] = []
+    withdrawals: list[float | None] = []
+    deposits: list[float | None] = []
     in_transaction_section = False
     prev_desc_continuation: str | None = None  # For multi-line: "BBPS Payment Received -" then "03 Jan '26 ₹ ... Credit"
 
     for i, line in enumerate(lines):
-        line = line.strip()
+        # Extractor output is usually already trimmed; only strip when an edge is whitespace
+        if line[:1].isspace() or line[-1:].isspace():
+            line = line.strip()
         if not line:
             continue
 
@@ -103,12 +124,12 @@ def parse_axis_pdf(lines: list[str]) -> pd.DataFrame | None:
             in_transaction_section = True
         if "**End of Transaction Summary**" in line:
             break
-        if _skip_line(line):
+        if _SKIP_RE.match(line):
             continue
         if not in_transaction_section and "₹" not in line:
             continue
 
-        m_date_only = pattern_date_only.match(line)
+        m_date_only = _PAT_DATE_ONLY.match(line)
 
         if m_date_only and prev_desc_continuation:
             date_str, amount_str, direction = m_date_only.group(1), m_date_only.group(2), m_date_only.group(3)
@@ -117,17 +138,17 @@ def parse_axis_pdf(lines: list[str]) -> pd.DataFrame | None:
         else:
             prev_desc_continuation = None
             # Try date-first pattern
-            m = pattern_date_first.match(line)
+            m = _PAT_DATE_FIRST.match(line)
             if m:
                 date_str, desc, amount_str, direction = m.group(1), m.group(2), m.group(3), m.group(4)
             else:
-                m = pattern_date_mid.match(line)
+                m = _PAT_DATE_MID.match(line)
                 if m:
                     desc_part, date_str, amount_str, direction = m.group(1), m.group(2), m.group(3), m.group(4)
                     desc = f"{desc_part} {date_str}".strip()
                 else:
                     # Line might be description continuation (e.g. "BBPS Payment Received -")
-                    if in_transaction_section and "₹" not in line and not re.match(r"^\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)", line, re.I):
+                    if in_transaction_section and "₹" not in line and not _AXIS_DATE_PREFIX_RE.match(line):
                         prev_desc_continuation = line
                     continue
 
@@ -136,22 +157,25 @@ def parse_axis_pdf(lines: list[str]) -> pd.DataFrame | None:
             continue
 
         try:
-            amount = float(amount_str.replace(",", ""))
+            amount = float(amount_str.translate(_NO_COMMA))
         except ValueError:
             continue
 
         is_credit = direction.strip().lower() == "credit"
-        parsed_rows.append({
-            "txn_date": dt.date(),
-            "description": desc.strip(),
-            "withdrawal_amt": None if is_credit else amount,
-            "deposit_amt": amount if is_credit else None,
-        })
-
-    if not parsed_rows:
+        txn_dates.append(dt.date())
+        descriptions.append(desc.strip())
+        withdrawals.append(None if is_credit else amount)
+        deposits.append(amount if is_credit else None)
+
+    if not txn_dates:
         return None
 
-    return pd.DataFrame(parsed_rows)
+    return pd.DataFrame({
+        "txn_date": txn_dates,
+        "description": descriptions,
+        "withdrawal_amt": withdrawals,
+        "deposit_amt": deposits,
+    })
 
 
 # Axis savings: PDF table extraction can put date on same line as amounts.
@@ -161,43 +185,43 @@ _AXIS_SAVINGS_TXN_LINE = re.compile(
     r"^(\d{2}-\d{2}-\d{4})\s+(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})(?:\s+(\d+))?\s*$"
 )
 _AXIS_OPENING_BALANCE = re.compile(r"^OPENING\s+BALANCE\s+([\d,]+\.\d{2})\s*$", re.I)
+# Headers, page markers and totals in savings statements (one alternation, searched per line)
+_AXIS_SAV_SKIP = re.compile(
+    r"^Tran Date"
+    r"|^Statement of Axis"
+    r"|^-- \d+ of \d+ --"
+    r"|^Page \d+"
+    r"|^Init\.?\s*$"
+    r"|^Br\s*$"
+    r"|TRANSACTION TOTAL"
+    r"|CLOSING BALANCE",
+    re.I,
+)
 
 
+@functools.lru_cache(maxsize=1024)
 def _parse_axis_savings_date(s: str) -> datetime | None:
     """Parse DD-MM-YYYY format."""
-    m = re.match(r"^(\d{2})-(\d{2})-(\d{4})\s*$", s.strip())
-    if not m:
-        return None
-    try:
-        return datetime(int(m.group(3)), int(m.group(2)), int(m.group(1)))
-    except ValueError:
-        return None
+    return _parse_ddmmyyyy(s.strip())
 
 
-def parse_axis_savings_pdf(lines: list[str]) -> pd.DataFrame | None:
+def parse_axis_savings_pdf(lines: list[str], hint: str | None = None) -> pd.DataFrame | None:
     """Parse Axis Bank savings account statements (Tran Date | Particulars | Debit | Credit | Balance)."""
-    haystack = " ".join(lines[:100]).lower()
-    if "statement of axis account" not in haystack and "axis" not in haystack:
+    if hint is None and not any_contains_ci(lines[:100], *_BANK_NAMES):
+        return None
+    haystack = header_text(lines, 100, hint)
+    if not SIGNATURE.search(haystack):
         return None
     if "tran date" not in haystack and "debit" not in haystack and "credit" not in haystack:
         return None
 
-    skip_patterns = [
-        r"^CLOSING BALANCE",
-        r"^Tran Date",
-        r"^Statement of Axis",
-        r"^-- \d+ of \d+ --",
-        r"^Page \d+",
-        r"^Init\.?\s*$",
-        r"^Br\s*$",
-        r"TRANSACTION TOTAL",
-        r"CLOSING BALANCE",
-    ]
-
-    def _skip(s: str) -> bool:
-        return any(re.search(p, s, re.I) for p in skip_patterns)
-
-    parsed_rows: list[dict[str, Any]] = []
+    # Columns are preallocated to the line count (an upper bound on rows) and truncated to j at the end
+    n = len(lines)
+    txn_dates: list[date | None] = [None] * n
+    descriptions: list[str] = [""] * n
+    withdrawals: list[float | None] = [None] * n
+    deposits: list[float | None] = [None] * n
+    j = 0
     prev_balance: float | None = None
     prev_desc: str | None = None
 
@@ -210,13 +234,13 @@ def parse_axis_savings_pdf(lines: list[str]) -> pd.DataFrame | None:
         m_open = _AXIS_OPENING_BALANCE.match(line_stripped)
         if m_open:
             try:
-                prev_balance = float(m_open.group(1).replace(",", ""))
+                prev_balance = float(m_open.group(1).translate(_NO_COMMA))
             except ValueError:
                 pass
             prev_desc = None
             continue
 
-        if _skip(line_stripped):
+        if _AXIS_SAV_SKIP.search(line_stripped):
             prev_desc = None
             continue
 
@@ -229,8 +253,8 @@ def parse_axis_savings_pdf(lines: list[str]) -> pd.DataFrame | None:
                 prev_desc = line_stripped
                 continue
             try:
-                num1 = float(num1_str.replace(",", ""))
-                num2 = float(num2_str.replace(",", ""))
+                num1 = float(num1_str.translate(_NO_COMMA))
+                num2 = float(num2_str.translate(_NO_COMMA))
             except ValueError:
                 prev_desc = line_stripped
                 continue
@@ -251,18 +275,24 @@ def parse_axis_savings_pdf(lines: list[str]) -> pd.DataFrame | None:
             if not desc:
                 desc = "Unknown"
 
-            parsed_rows.append({
-                "txn_date": dt.date(),
-                "description": desc,
-                "withdrawal_amt": None if is_credit else amount,
-                "deposit_amt": amount if is_credit else None,
-            })
+            txn_dates[j] = dt.date()
+            descriptions[j] = desc
+            if is_credit:
+                deposits[j] = amount
+            else:
+                withdrawals[j] = amount
+            j += 1
             prev_balance = new_balance
             prev_desc = None
         else:
             # Not a txn line - accumulate as description for next line
             prev_desc = f"{prev_desc} {line_stripped}".strip() if prev_desc else line_stripped
 
-    if not parsed_rows:
+    if not j:
         return None
-    return pd.DataFrame(parsed_rows)
+    return pd.DataFrame({
+        "txn_date": txn_dates[:j],
+        "description": descriptions[:j],
+        "withdrawal_amt": withdrawals[:j],
+        "deposit_amt": deposits[:j],
+    })
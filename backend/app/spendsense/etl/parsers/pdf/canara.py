@@ -3,76 +3,84 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
-from typing import Any
+from datetime import date
 
 import pandas as pd  # type: ignore[import-untyped]
 
-
-def parse_canara_pdf(lines: list[str]) -> pd.DataFrame | None:
+from ..common import _NO_COMMA, _parse_ddmmyyyy
+from .detect import any_contains_ci, header_text
+
+# Bank names this parser requires in its lowered header window (pdf.BANK_SIGNATURES reuses it)
+_BANK_NAMES = ("canara", "cnrb")
+SIGNATURE = re.compile("|".join(_BANK_NAMES))
+
+# Line with date and amount+balance at end: "DD-MM-YYYY [desc] AMOUNT BALANCE"
+# The desc group is optional so "DD-MM-YYYY AMOUNT BALANCE" matches the same pattern (group 2 is None)
+_CANARA_AMT_RE = re.compile(
+    r"^(\d{2}-\d{2}-\d{4})\s+(?:(.+?)\s+)?([\d,]+\.?\d*)\s+([\d,]+\.?\d*)\s*$"
+)
+_DATE_RE = re.compile(r"^(\d{2}-\d{2}-\d{4})\b")
+_SECTION_START_RE = re.compile(r"Date\s+Particulars\s+Deposits|Opening\s+Balance", re.I)
+# Page markers, table headers and bare cheque labels (one alternation, anchored via .match)
+_SKIP_RE = re.compile(
+    r"(?-i:--\s+\d+\s+of\s+\d+\s+--\s*$)"
+    r"|Date\s+Particulars\s+Deposits"
+    r"|Opening\s+Balance"
+    r"|page\s+\d+\s*$"
+    r"|(?-i:Chq:\s*\d*$)",
+    re.I,
+)
+_CHQ_ONLY_RE = re.compile(r"^Chq:\s*\d*$")
+_NUMERIC_ONLY_RE = re.compile(r"^[\d,\.\s]+$")
+_TRAILING_AMOUNTS_RE = re.compile(r"[\d,]+\.?\d*\s+[\d,]+\.?\d*\s*$")
+_BARE_AMOUNT_LINE_RE = re.compile(r"^\d{2}-\d{2}-\d{4}\s+[\d,]+\.?\d*\s+[\d,]+\.?\d*$")
+# Credit markers in upper-cased narration (IMPS-CR also covers MOB-IMPS-CR and INET-IMPS-CR)
+_CREDIT_RE = re.compile(r"IMPS-CR|INET-IMPS CR|UPI[/ ]CR|SBINT|NEFT[- ]CR|RTGS[- ]CR")
+
+
+def _is_credit(desc: str) -> bool:
+    """Classify a Canara narration as a credit from its IMPS/UPI/NEFT/RTGS markers."""
+    upper = desc.upper()
+    if _CREDIT_RE.search(upper):
+        return True
+    cr = upper.find("CR/")
+    return cr >= 0 and "DR/" not in upper[: max(0, cr - 3)]
+
+
+def parse_canara_pdf(lines: list[str], hint: str | None = None) -> pd.DataFrame | None:
     """Parse Canara Bank PDF statements. Format: Date, Particulars, Deposits/Withdrawals, Balance."""
     if not lines:
         return None
 
-    haystack = " ".join(lines[:80]).lower()
-    if "canara" not in haystack and "cnrb" not in haystack:
+    # Without a shared hint, bail out line by line before building the joined window
+    if hint is None and not any_contains_ci(lines[:80], *_BANK_NAMES):
+        return None
+    haystack = header_text(lines, 80, hint)
+    if not SIGNATURE.search(haystack):
         return None
     if "statement for" not in haystack and "particulars" not in haystack:
         return None
 
-    # Line with date and amount+balance at end: "DD-MM-YYYY [desc] AMOUNT BALANCE"
-    # Try with optional desc first (for "DD-MM-YYYY AMOUNT BALANCE"), then with desc
-    amount_line_with_desc = re.compile(
-        r"^(\d{2}-\d{2}-\d{4})\s+(.+?)\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)\s*$"
-    )
-    amount_line_no_desc = re.compile(
-        r"^(\d{2}-\d{2}-\d{4})\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)\s*$"
-    )
-    date_regex = re.compile(r"^(\d{2}-\d{2}-\d{4})\b")
-
-    def _skip_line(s: str) -> bool:
-        return bool(
-            re.match(r"^--\s+\d+\s+of\s+\d+\s+--\s*$", s)
-            or re.match(r"^Date\s+Particulars\s+Deposits", s, re.I)
-            or re.match(r"^Opening\s+Balance", s, re.I)
-            or re.match(r"^page\s+\d+\s*$", s, re.I)
-            or re.match(r"^Chq:\s*$", s)
-            or re.match(r"^Chq:\s*\d+$", s)
-        )
-
-    def _is_section_start(s: str) -> bool:
-        return bool(
-            re.match(r"^Date\s+Particulars\s+Deposits", s, re.I)
-            or re.match(r"^Opening\s+Balance", s, re.I)
-        )
-
-    def _is_credit(desc: str) -> bool:
-        upper = desc.upper()
-        if "MOB-IMPS-CR" in upper or "IMPS-CR" in upper:
-            return True
-        if "UPI/CR" in upper or "UPI CR" in upper:
-            return True
-        if "SBINT" in upper:
-            return True
-        if "INET-IMPS-CR" in upper or "INET-IMPS CR" in upper:
-            return True
-        if "NEFT CR" in upper or "NEFT-CR" in upper or "RTGS CR" in upper or "RTGS-CR" in upper:
-            return True
-        if "CR/" in upper and "DR/" not in upper[: max(0, upper.find("CR/") - 3)]:
-            return True
-        return False
-
-    parsed_rows: list[dict[str, Any]] = []
+    # Columns are preallocated to the line count (an upper bound on rows) and truncated to j at the end
+    n = len(lines)
+    txn_dates: list[date | None] = [None] * n
+    descriptions: list[str] = [""] * n
+    withdrawals: list[float | None] = [None] * n
+    deposits: list[float | None] = [None] * n
+    j = 0
     description_parts: list[str] = []
     in_section = False
     i = 0
 
     while i < len(lines):
-        line = lines[i].strip()
+        line = lines[i]
+        # Extractor output is usually already trimmed; only strip when an edge is whitespace
+        if line[:1].isspace() or line[-1:].isspace():
+            line = line.strip()
 
-        if _is_section_start(line):
+        if _SECTION_START_RE.match(line):
             in_section = True
-        if _skip_line(line):
+        if _SKIP_RE.match(line):
             i += 1
             continue
         if not in_section:
@@ -80,25 +88,17 @@ def parse_canara_pdf(lines: list[str]) -> pd.DataFrame | None:
             continue
 
         # Amount line: "DD-MM-YYYY ... AMOUNT BALANCE" or "DD-MM-YYYY AMOUNT BALANCE"
-        amt_match = amount_line_with_desc.match(line)
-        if not amt_match:
-            amt_match = amount_line_no_desc.match(line)
+        amt_match = _CANARA_AMT_RE.match(line)
         if amt_match:
-            date_str = amt_match.group(1)
-            if len(amt_match.groups()) >= 4:
-                desc_part = amt_match.group(2).strip()
-                amount_val = amt_match.group(3).replace(",", "")
-            else:
-                desc_part = ""
-                amount_val = amt_match.group(2).replace(",", "")
-            try:
-                amount_float = float(amount_val)
-                dt = datetime.strptime(date_str, "%d-%m-%Y")
-                txn_date = dt.date()
-
+            date_str, desc_part, amount_str, _balance = amt_match.groups()
+            desc_part = desc_part.strip() if desc_part else ""
+            dt = _parse_ddmmyyyy(date_str)
+            # "[\d,]+\.?\d*" only fails float() when it holds no digit (just commas/dots); such rows are skipped
+            if dt is not None and amount_str.strip(",."):
+                amount = float(amount_str.translate(_NO_COMMA))
                 # Add desc_part (middle of amount line) if it's narrative, not amount/balance
-                if desc_part and not re.match(r"^[\d,\.\s]+$", desc_part):
-                    if not re.search(r"[\d,]+\.?\d*\s+[\d,]+\.?\d*\s*$", desc_part):
+                if desc_part and not _NUMERIC_ONLY_RE.match(desc_part):
+                    if not _TRAILING_AMOUNTS_RE.search(desc_part):
                         description_parts.append(desc_part)
 
                 # Prune fragments that look like amount lines from concatenation
@@ -107,46 +107,43 @@ def parse_canara_pdf(lines: list[str]) -> pd.DataFrame | None:
                     p = p.strip()
                     if not p:
                         continue
-                    if re.match(r"^\d{2}-\d{2}-\d{4}\s+[\d,]+\.?\d*\s+[\d,]+\.?\d*$", p):
+                    if _BARE_AMOUNT_LINE_RE.match(p):
                         continue
                     parts_clean.append(p)
                 description = " ".join(parts_clean)
 
+                txn_dates[j] = dt.date()
+                descriptions[j] = description
                 if _is_credit(description):
-                    parsed_rows.append({
-                        "txn_date": txn_date,
-                        "description": description,
-                        "withdrawal_amt": None,
-                        "deposit_amt": amount_float,
-                    })
+                    deposits[j] = amount
                 else:
-                    parsed_rows.append({
-                        "txn_date": txn_date,
-                        "description": description,
-                        "withdrawal_amt": amount_float,
-                        "deposit_amt": None,
-                    })
-            except ValueError:
-                pass
+                    withdrawals[j] = amount
+                j += 1
 
             description_parts = []
             i += 1
             continue
 
         # Date-only line: "DD-MM-YYYY" - start of new block (amount on next line)
-        if date_regex.match(line) and not amount_line_with_desc.match(line) and not amount_line_no_desc.match(line):
-            rest = line[date_regex.match(line).end() :].strip()
+        date_match = _DATE_RE.match(line)
+        if date_match:
+            rest = line[date_match.end() :].strip()
             if rest:
                 description_parts.append(rest)
             i += 1
             continue
 
         # Description continuation
-        if line and not re.match(r"^Chq:\s*\d*$", line):
+        if line and not _CHQ_ONLY_RE.match(line):
             description_parts.append(line)
         i += 1
 
-    if not parsed_rows:
+    if not j:
         return None
 
-    return pd.DataFrame(parsed_rows)
+    return pd.DataFrame({
+        "txn_date": txn_dates[:j],
+        "description": descriptions[:j],
+        "withdrawal_amt": withdrawals[:j],
+        "deposit_amt": deposits[:j],
+    })
@@ -0,0 +1,37 @@
+"""Cheap bank-detection helpers shared by the line-based PDF parsers."""
+
+from __future__ import annotations
+
+
+def any_contains_ci(lines: list[str], *needles: str) -> bool:
+    """True if any line contains any of the (lowercase) needles, case-insensitively.
+
+    Stops at the first hit, so documents from other banks never pay for a joined
+    and lowercased header window.
+    """
+    for line in lines:
+        lower = line.lower()
+        for needle in needles:
+            if needle in lower:
+                return True
+    return False
+
+
+# Widest header window any parser looks at
+HINT_LINES = 100
+
+
+def bank_hint(lines: list[str]) -> str:
+    """Lower-cased, space-joined first HINT_LINES lines; build once and pass to each parser as ``hint``."""
+    return " ".join(lines[:HINT_LINES]).lower()
+
+
+def header_text(lines: list[str], n: int, hint: str | None = None) -> str:
+    """``" ".join(lines[:n]).lower()``, sliced out of a precomputed bank_hint when one is given."""
+    if hint is not None and 0 < n <= HINT_LINES:
+        window = lines[:HINT_LINES]
+        # lower() can change length for a few characters (e.g. U+0130); only slice when it didn't
+        if len(hint) == sum(map(len, window)) + len(window) - 1:
+            head = window[:n]
+            return hint[: sum(map(len, head)) + len(head) - 1]
+    return " ".join(lines[:n]).lower()
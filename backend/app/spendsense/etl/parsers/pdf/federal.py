@@ -4,130 +4,127 @@ from __future__ import annotations
 
 import re
 from datetime import date
-from typing import Any
 
 import pandas as pd  # type: ignore[import-untyped]
 
+from ..common import _NO_COMMA
+from .detect import header_text
+
+# Bank names this parser requires in its lowered header window (pdf.BANK_SIGNATURES reuses it)
+SIGNATURE = re.compile(r"federal|fdrl")
+
 # Federal uses "DD MMM" format; year inferred from statement period (Apr–Mar)
-MONTH_TO_NUM = {
-    "jan": "01", "feb": "02", "mar": "03", "apr": "04", "may": "05", "jun": "06",
-    "jul": "07", "aug": "08", "sep": "09", "oct": "10", "nov": "11", "dec": "12",
+MONTH_TO_NUM: dict[str, int] = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
 }
+# Apr-Dec fall in the statement's start year, Jan-Mar in its end year
+_START_YEAR_MONTHS = frozenset({"apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"})
+
+# Statement period bounds, e.g. "1 April 2025 to 31 March 2026"
+_YEAR_START_RE = re.compile(r"(?:1\s+)?(?:April|Apr)\s+(\d{4})", re.I)
+_YEAR_END_RE = re.compile(r"(?:31\s+)?(?:March|Mar)\s+(\d{4})", re.I)
+# Allow 1 or 2 digit day (e.g. "1 Dec" or "01 Dec")
+_DATE_RE = re.compile(r"^(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s*$", re.I)
+# Amount and balance: same line "5,000.00 17,860.76" OR separate lines (group 2 is None for a lone amount)
+_AMOUNT_RE = re.compile(r"^([\d,]+\.?\d*)(?:\s+([\d,]+\.?\d*))?\s*$")
+
+
+def _is_credit(desc: str) -> bool:
+    """Direction from description: credit vs debit ("upi in" also covers "upi in/")."""
+    lower = desc.lower()
+    return "upi in" in lower or "upiin" in lower
 
 
-def parse_federal_pdf(lines: list[str], force: bool = False) -> pd.DataFrame | None:
+def parse_federal_pdf(lines: list[str], force: bool = False, hint: str | None = None) -> pd.DataFrame | None:
     """Parse Federal Bank PDF statements. Format: Date (DD MMM), Description, Amount Balance.
     
     Args:
         lines: List of text lines extracted from PDF
         force: If True, skip bank name check and attempt parsing anyway (useful when bank_code is already known)
+        hint: Optional precomputed detect.bank_hint(lines), shared across parsers
     """
     if not lines:
         return None
 
     # Only check for bank name if not forced (when bank_code is already known, we can skip this check)
     if not force:
-        haystack = " ".join(lines[:100]).lower()
-        if "federal" not in haystack and "fdrl" not in haystack:
+        haystack = header_text(lines, 100, hint)
+        if not SIGNATURE.search(haystack):
             return None
 
+    # Strip once up front; the loops below look at each line several times
+    lines = [line.strip() for line in lines]
+
     # Infer year from statement period (e.g. "1 April 2025 to 31 March 2026")
     start_year = 2025
     end_year = 2026
     for line in lines[:60]:
-        m = re.search(r"(?:1\s+)?(?:April|Apr)\s+(\d{4})", line, re.I)
+        m = _YEAR_START_RE.search(line)
         if m:
             start_year = int(m.group(1))
             break
     for line in lines[:60]:
-        m = re.search(r"(?:31\s+)?(?:March|Mar)\s+(\d{4})", line, re.I)
+        m = _YEAR_END_RE.search(line)
         if m:
             end_year = int(m.group(1))
             break
 
-    # Allow 1 or 2 digit day (e.g. "1 Dec" or "01 Dec")
-    date_regex = re.compile(r"^(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s*$", re.I)
-    # Amount and balance: same line "5,000.00 17,860.76" OR separate lines
-    amount_balance_regex = re.compile(r"^([\d,]+\.?\d*)\s+([\d,]+\.?\d*)\s*$")
-    single_amount_regex = re.compile(r"^([\d,]+\.?\d*)\s*$")
-
-    # Direction from description: credit vs debit
-    def _is_credit(desc: str) -> bool:
-        lower = desc.lower()
-        return "upi in" in lower or "upi in/" in lower or "upiin" in lower
-
-    parsed_rows: list[dict[str, Any]] = []
+    txn_dates: list[date] = []
+    descriptions: list[str] = []
+    withdrawals: list[float | None] = []
+    deposits: list[float | None] = []
     i = 0
     date_matches_found = 0  # Debug counter
 
     while i < len(lines):
-        line = lines[i].strip()
-        date_match = date_regex.match(line)
+        line = lines[i]
+        date_match = _DATE_RE.match(line)
         if not date_match:
             i += 1
             continue
         
         date_matches_found += 1
 
-        day_str = date_match.group(1)
-        mon = date_match.group(2)
-        mon_num = MONTH_TO_NUM.get(mon.lower(), "01")
-        year = start_year if mon.lower() in ("apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec") else end_year
-        day = int(day_str)
-        txn_date = date(year, int(mon_num), day)
+        day_str, mon = date_match.groups()
+        mon_low = mon.lower()
+        year = start_year if mon_low in _START_YEAR_MONTHS else end_year
+        txn_date = date(year, MONTH_TO_NUM.get(mon_low, 1), int(day_str))
         i += 1
 
         description_parts: list[str] = []
-        withdrawal_amt: float | None = None
-        deposit_amt: float | None = None
+        amount: float | None = None
 
         while i < len(lines):
-            candidate = lines[i].strip()
+            candidate = lines[i]
 
-            if date_regex.match(candidate):
+            if _DATE_RE.match(candidate):
                 break
 
             # Skip pure numeric ref lines (0, 0000, 5411) - must be before amount matching
-            if re.match(r"^\d{1,6}$", candidate):
+            if candidate.isdecimal() and len(candidate) <= 6:
                 i += 1
                 continue
 
             # Same line: "5,000.00 17,860.76"
-            ab_match = amount_balance_regex.match(candidate)
-            if ab_match:
-                amount_val = ab_match.group(1).replace(",", "")
-                try:
-                    amount_float = float(amount_val)
-                    desc = " ".join(part.strip() for part in description_parts if part.strip())
-                    if _is_credit(desc):
-                        deposit_amt = amount_float
-                    else:
-                        withdrawal_amt = amount_float
+            amt_match = _AMOUNT_RE.match(candidate)
+            # A group of only commas/dots has no number in it (float() would fail), so it is not an amount
+            if amt_match and amt_match.group(2) is not None:
+                if amt_match.group(1).strip(",."):
+                    amount = float(amt_match.group(1).translate(_NO_COMMA))
                     i += 1
                     break
-                except ValueError:
-                    pass
 
             # Separate lines: "5,000.00" then "17,860.76" (amount then balance)
-            amt_match = single_amount_regex.match(candidate)
-            if amt_match and description_parts and i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if single_amount_regex.match(next_line):
-                    amount_val = amt_match.group(1).replace(",", "")
-                    try:
-                        amount_float = float(amount_val)
-                        desc = " ".join(part.strip() for part in description_parts if part.strip())
-                        if _is_credit(desc):
-                            deposit_amt = amount_float
-                        else:
-                            withdrawal_amt = amount_float
-                        i += 2
-                        break
-                    except ValueError:
-                        pass
+            elif amt_match and description_parts and i + 1 < len(lines):
+                next_match = _AMOUNT_RE.match(lines[i + 1])
+                if next_match and next_match.group(2) is None and amt_match.group(1).strip(",."):
+                    amount = float(amt_match.group(1).translate(_NO_COMMA))
+                    i += 2
+                    break
 
             # Skip pure numeric ref lines like "0", "0000", "5411" between description and amount
-            if re.match(r"^\d{1,6}$", candidate):
+            if candidate.isdecimal() and len(candidate) <= 6:
                 i += 1
                 continue
 
@@ -136,16 +133,15 @@ def parse_federal_pdf(lines: list[str], force: bool = False) -> pd.DataFrame | N
 
             i += 1
 
-        if withdrawal_amt is not None or deposit_amt is not None:
-            description = " ".join(part.strip() for part in description_parts if part.strip())
-            parsed_rows.append({
-                "txn_date": txn_date,
-                "description": description,
-                "withdrawal_amt": withdrawal_amt,
-                "deposit_amt": deposit_amt,
-            })
+        if amount is not None:
+            description = " ".join(description_parts)
+            txn_dates.append(txn_date)
+            descriptions.append(description)
+            is_credit = _is_credit(description)
+            withdrawals.append(None if is_credit else amount)
+            deposits.append(amount if is_credit else None)
 
-    if not parsed_rows:
+    if not txn_dates:
         # Log diagnostic info if we found date matches but no transactions
         if date_matches_found > 0:
             import logging
@@ -154,4 +150,9 @@ def parse_federal_pdf(lines: list[str], force: bool = False) -> pd.DataFrame | N
                         date_matches_found, lines[:20] if len(lines) > 20 else lines)
         return None
 
-    return pd.DataFrame(parsed_rows)
+    return pd.DataFrame({
+        "txn_date": txn_dates,
+        "description": descriptions,
+        "withdrawal_amt": withdrawals,
+        "deposit_amt": deposits,
+    })
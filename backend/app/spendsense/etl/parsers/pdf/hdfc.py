@@ -9,85 +9,128 @@ Supports:
 from __future__ import annotations
 
 import re
-from datetime import datetime
-from typing import Any
+from datetime import date, datetime
 
 import pandas as pd  # type: ignore[import-untyped]
 
+from ..common import _ASCII_DIGITS, _NO_COMMA
+from .detect import header_text
+
+# Bank names this parser requires in its lowered header window (pdf.BANK_SIGNATURES reuses it)
+SIGNATURE = re.compile(r"hdfc")
+
 # Single-line: Date Narration Ref ValueDt Amt1 Amt2 (Amt1=withdrawal or deposit, Amt2=closing)
 _HDFC_SINGLE_LINE = re.compile(
     r"^(\d{2}/\d{2}/\d{2})\s+(.+)\s+(\d{2}/\d{2}/\d{2})\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s*$"
 )
 
 
+def _is_ddmmyy(tok: str) -> bool:
+    return len(tok) == 8 and tok[2] == "/" and tok[5] == "/" and (tok[:2] + tok[3:5] + tok[6:]).isdecimal()
+
+
 def _parse_hdfc_date(s: str) -> datetime | None:
     """Parse DD/MM/YY format."""
-    m = re.match(r"^(\d{2})/(\d{2})/(\d{2})\s*$", s.strip())
-    if not m:
+    s = s.strip()
+    if not _is_ddmmyy(s):
         return None
+    yy = int(s[6:8])
+    year = 2000 + yy if yy < 50 else 1900 + yy
     try:
-        yy = int(m.group(3))
-        year = 2000 + yy if yy < 50 else 1900 + yy
-        return datetime(year, int(m.group(2)), int(m.group(1)))
+        return datetime(year, int(s[3:5]), int(s[0:2]))
     except ValueError:
         return None
 
 
+def _is_amount(tok: str) -> bool:
+    """Digits/commas, a dot and two digits, like the regex's amount groups."""
+    digits = tok[:-3].translate(_NO_COMMA)
+    return len(tok) >= 4 and tok[-3] == "." and tok[-2:].isdecimal() and (not digits or digits.isdecimal())
+
+
+def _split_single_line(line: str) -> tuple[str, str, str, str, str] | None:
+    """Split a single-line row into _HDFC_SINGLE_LINE's groups with str.split; None if the tokens don't fit.
+
+    The amounts and value date are the last three whitespace-separated tokens, which is what the greedy
+    narration group leaves for them, so a hit here is always a regex hit with the same groups. Lines this
+    rejects still go through the regex (e.g. a blank narration between runs of spaces).
+    """
+    parts = line.rsplit(None, 3)
+    if len(parts) != 4:
+        return None
+    head, value_dt, amt1, amt2 = parts
+    first = head.split(None, 1)
+    if len(first) != 2:
+        return None
+    date_str, narration = first
+    if not (_is_ddmmyy(date_str) and _is_ddmmyy(value_dt) and _is_amount(amt1) and _is_amount(amt2)):
+        return None
+    return date_str, narration, value_dt, amt1, amt2
+
+
 def _parse_hdfc_single_line_format(lines: list[str]) -> pd.DataFrame | None:
-    """Parse HDFC statements where each transaction is on one line."""
-    parsed_rows: list[dict[str, Any]] = []
+    """Parse HDFC statements where each transaction is on one line. Expects pre-stripped lines."""
+    txn_dates: list[date] = []
+    descriptions: list[str] = []
+    withdrawals: list[float | None] = []
+    deposits: list[float | None] = []
     prev_balance: float | None = None
 
-    skip = {"date narration chq./ref.no.", "statementof account", "hdfc bank limited"}
-
-    for line in lines:
-        line_stripped = line.strip()
+    for line_stripped in lines:
         if not line_stripped or len(line_stripped) < 30:
             continue
-        if any(s in line_stripped.lower().replace(" ", "") for s in skip):
+        # Cheap "DD/" prefilter before the five-group regex; most lines are not transactions, and the
+        # header/footer lines ("Date Narration Chq...", "Statement of account", ...) never start with a date
+        if not line_stripped[:2].isdecimal() or line_stripped[2] != "/":
             continue
 
-        m = _HDFC_SINGLE_LINE.match(line_stripped)
-        if not m:
-            continue
+        fields = _split_single_line(line_stripped)
+        if fields is None:
+            m = _HDFC_SINGLE_LINE.match(line_stripped)
+            if not m:
+                continue
+            fields = m.groups()
 
-        date_str, narration_ref, value_dt, amt1_str, amt2_str = m.groups()
+        date_str, narration_ref, value_dt, amt1_str, amt2_str = fields
         dt = _parse_hdfc_date(date_str)
         if not dt:
             continue
-        try:
-            amt1 = float(amt1_str.replace(",", ""))
-            amt2 = float(amt2_str.replace(",", ""))
-        except ValueError:
-            continue
-
         # amt1 = withdrawal or deposit, amt2 = closing balance
-        closing = amt2
+        amt1 = float(amt1_str.translate(_NO_COMMA))
+        closing = float(amt2_str.translate(_NO_COMMA))
         if prev_balance is not None:
             is_credit = closing > prev_balance
         else:
             is_credit = False
 
-        parsed_rows.append({
-            "txn_date": dt.date(),
-            "description": narration_ref.strip(),
-            "withdrawal_amt": None if is_credit else amt1,
-            "deposit_amt": amt1 if is_credit else None,
-        })
+        txn_dates.append(dt.date())
+        descriptions.append(narration_ref.strip())
+        withdrawals.append(None if is_credit else amt1)
+        deposits.append(amt1 if is_credit else None)
         prev_balance = closing
 
-    return pd.DataFrame(parsed_rows) if parsed_rows else None
+    if not txn_dates:
+        return None
+    return pd.DataFrame({
+        "txn_date": txn_dates,
+        "description": descriptions,
+        "withdrawal_amt": withdrawals,
+        "deposit_amt": deposits,
+    })
 
 
-def parse_hdfc_pdf(lines: list[str]) -> pd.DataFrame | None:
+def parse_hdfc_pdf(lines: list[str], hint: str | None = None) -> pd.DataFrame | None:
     """Parse HDFC bank PDF statements (single-line or vertical format)."""
     if not lines:
         return None
 
-    haystack = " ".join(lines[:80]).lower()
-    if "hdfc" not in haystack:
+    haystack = header_text(lines, 80, hint)
+    if not SIGNATURE.search(haystack):
         return None
 
+    # Strip once up front; both formats look at each line several times
+    lines = [line.strip() for line in lines]
+
     # Try single-line format first (Date Narration Ref ValueDt Amt Amt)
     df = _parse_hdfc_single_line_format(lines)
     if df is not None and not df.empty:
@@ -96,11 +139,17 @@ def parse_hdfc_pdf(lines: list[str]) -> pd.DataFrame | None:
     # Fall back to vertical format
     date_regex = re.compile(r"^(\d{2}/\d{2}/\d{2})$")
     amount_regex = re.compile(r"([\d,]+\.?\d*)")
-    parsed_rows: list[dict[str, Any]] = []
+    txn_dates_raw: list[str] = []
+    descriptions_v: list[str] = []
+    withdrawals_v: list[float | None] = []
+    deposits_v: list[float | None] = []
+    balances: list[float | None] = []
+    prev_balance: float | None = None  # balance of the last recorded row (0 if it had none)
+    raw_txn_ids: list[str | None] = []
     i = 0
 
     while i < len(lines):
-        line = lines[i].strip()
+        line = lines[i]
         date_match = date_regex.match(line)
         if not date_match:
             i += 1
@@ -117,12 +166,12 @@ def parse_hdfc_pdf(lines: list[str]) -> pd.DataFrame | None:
         closing_balance: float | None = None
 
         while i < len(lines):
-            candidate = lines[i].strip()
+            candidate = lines[i]
 
             if date_regex.match(candidate):
                 break
 
-            if not chq_ref_no and (candidate.startswith("UPI-") or candidate.startswith("0000") or re.match(r"^\d+", candidate)):
+            if not chq_ref_no and (candidate.startswith("UPI-") or candidate.startswith("0000") or candidate[:1].isdecimal()):
                 chq_ref_no = candidate
                 i += 1
                 continue
@@ -133,22 +182,29 @@ def parse_hdfc_pdf(lines: list[str]) -> pd.DataFrame | None:
                 i += 1
                 continue
 
+            # Lines without a digit can't hold an amount and always end up in the narration
+            if candidate.isascii() and _ASCII_DIGITS.isdisjoint(candidate):
+                if candidate:
+                    narration_parts.append(candidate)
+                i += 1
+                continue
+
             amount_match = amount_regex.search(candidate)
-            if amount_match and len(candidate.split()) <= 2:
+            # "At most two tokens"; maxsplit stops splitting after the third, so long narrations aren't tokenised
+            if amount_match and len(candidate.split(None, 2)) <= 2:
                 amount_val = amount_match.group(1).replace(",", "")
                 try:
                     amount_float = float(amount_val)
                     if i + 1 < len(lines):
-                        next_line = lines[i + 1].strip()
+                        next_line = lines[i + 1]
                         next_amount_match = amount_regex.search(next_line)
-                        if next_amount_match and len(next_line.split()) <= 2:
+                        if next_amount_match and len(next_line.split(None, 2)) <= 2:
                             balance_val = next_amount_match.group(1).replace(",", "")
                             try:
                                 balance_float = float(balance_val)
                                 closing_balance = balance_float
 
-                                if parsed_rows:
-                                    prev_balance = parsed_rows[-1].get("balance", 0) or 0
+                                if prev_balance is not None:
                                     if balance_float > prev_balance:
                                         deposit_amt = amount_float
                                     else:
@@ -172,20 +228,27 @@ def parse_hdfc_pdf(lines: list[str]) -> pd.DataFrame | None:
             i += 1
 
         if txn_date and (withdrawal_amt is not None or deposit_amt is not None):
-            description = " ".join(part.strip() for part in narration_parts if part.strip())
-
-            row: dict[str, Any] = {
-                "txn_date": value_date if value_date else txn_date,
-                "description": description,
-                "withdrawal_amt": withdrawal_amt,
-                "deposit_amt": deposit_amt,
-                "balance": closing_balance,
-            }
-            if chq_ref_no:
-                row["raw_txn_id"] = chq_ref_no
-            parsed_rows.append(row)
-
-    if not parsed_rows:
+            description = " ".join(narration_parts)
+
+            txn_dates_raw.append(value_date if value_date else txn_date)
+            descriptions_v.append(description)
+            withdrawals_v.append(withdrawal_amt)
+            deposits_v.append(deposit_amt)
+            balances.append(closing_balance)
+            prev_balance = closing_balance or 0.0
+            raw_txn_ids.append(chq_ref_no or None)
+
+    if not txn_dates_raw:
         return None
 
-    return pd.DataFrame(parsed_rows)
+    columns: dict[str, list] = {
+        "txn_date": txn_dates_raw,
+        "description": descriptions_v,
+        "withdrawal_amt": withdrawals_v,
+        "deposit_amt": deposits_v,
+        "balance": balances,
+    }
+    # Only rows with a cheque/ref number carry raw_txn_id; the column is omitted when none do
+    if any(raw_txn_ids):
+        columns["raw_txn_id"] = raw_txn_ids
+    return pd.DataFrame(columns)
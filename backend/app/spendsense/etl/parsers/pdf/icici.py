@@ -3,54 +3,57 @@
 from __future__ import annotations
 
 import re
-from typing import Any
 
 import pandas as pd  # type: ignore[import-untyped]
 
+from ..common import _ASCII_DIGITS
+from .detect import header_text
 
-def parse_icici_pdf(lines: list[str]) -> pd.DataFrame | None:
+# Bank names this parser requires in its lowered header window (pdf.BANK_SIGNATURES reuses it)
+SIGNATURE = re.compile(r"icici")
+
+# Support multiple date formats: DD/MM/YYYY, DD-MM-YYYY, D/M/YYYY (same separator both times)
+_DATE_RE = re.compile(r"^(\d{1,2}([/-])\d{1,2}\2\d{4})$")
+
+
+def _match_date(line: str) -> str | None:
+    m = _DATE_RE.match(line)
+    return m.group(1) if m else None
+
+
+def parse_icici_pdf(lines: list[str], hint: str | None = None) -> pd.DataFrame | None:
     """Parse ICICI bank PDF statements as fallback when generic extraction fails."""
     if not lines:
         return None
 
-    # Detect ICICI bank
-    if not any("icici" in line.lower() for line in lines[:50]):
+    # Detect ICICI bank (one lower() over the joined header, shared across parsers via hint)
+    haystack = header_text(lines, 50, hint)
+    if not SIGNATURE.search(haystack):
         return None
 
-    # Support multiple date formats: DD/MM/YYYY, DD-MM-YYYY, D/M/YYYY
-    date_regexes = [
-        re.compile(r"^(\d{2}/\d{2}/\d{4})$"),
-        re.compile(r"^(\d{2}-\d{2}-\d{4})$"),
-        re.compile(r"^(\d{1,2}/\d{1,2}/\d{4})$"),
-        re.compile(r"^(\d{1,2}-\d{1,2}-\d{4})$"),
-    ]
-
-    def _match_date(line: str) -> str | None:
-        for regex in date_regexes:
-            m = regex.match(line.strip())
-            if m:
-                return m.group(1)
-        return None
+    # Strip once up front; the loops below look at each line several times
+    lines = [line.strip() for line in lines]
 
     # Amount format: numbers with commas (e.g., 21.00, 3,035.00)
     amount_regex = re.compile(r"([\d,]+\.?\d*)")
-    parsed_rows: list[dict[str, Any]] = []
-    i = 0
-
-    # Look for transaction table start - flexible header detection
-    header_found = False
-    for j, line in enumerate(lines[:100]):
-        lower = line.lower()
-        if "value date" in lower or "transaction date" in lower or "valuedate" in lower or "transactiondate" in lower:
-            header_found = True
-            i = j + 1
-            break
-
-    if not header_found:
-        i = 0
+    txn_dates: list[str] = []
+    descriptions: list[str] = []
+    withdrawals: list[float | None] = []
+    deposits: list[float | None] = []
+    balances: list[float | None] = []
+    prev_balance: float | None = None  # balance of the last recorded row (0 if it had none)
+
+    # Look for transaction table start - flexible header detection (one lowered join, then map back to a line)
+    header_lower = "\n".join(lines[:100]).lower()
+    positions = [
+        pos
+        for pos in (header_lower.find(key) for key in ("value date", "transaction date", "valuedate", "transactiondate"))
+        if pos >= 0
+    ]
+    i = header_lower.count("\n", 0, min(positions)) + 1 if positions else 0
 
     while i < len(lines):
-        line = lines[i].strip()
+        line = lines[i]
         txn_date = _match_date(line)
         if not txn_date:
             i += 1
@@ -79,12 +82,19 @@ def parse_icici_pdf(lines: list[str]) -> pd.DataFrame | None:
 
         # Look for amounts and description - support 2-line (amount+balance) and 3-line patterns
         while i < len(lines):
-            candidate = lines[i].strip()
+            candidate = lines[i]
 
             # Check if we hit the next transaction (new date)
             if _match_date(candidate):
                 break
 
+            # Lines without a digit can't hold an amount and always end up in the description
+            if candidate.isascii() and _ASCII_DIGITS.isdisjoint(candidate):
+                if candidate:
+                    description_parts.append(candidate)
+                i += 1
+                continue
+
             # Check for amount (withdrawal or deposit)
             amount_match = amount_regex.search(candidate)
             if amount_match:
@@ -94,7 +104,7 @@ def parse_icici_pdf(lines: list[str]) -> pd.DataFrame | None:
 
                     # Try 3-line pattern: withdrawal/deposit, next amount, balance
                     if i + 1 < len(lines):
-                        next_candidate = lines[i + 1].strip()
+                        next_candidate = lines[i + 1]
                         next_amount_match = amount_regex.search(next_candidate)
                         if next_amount_match:
                             next_amount_val = next_amount_match.group(1).replace(",", "")
@@ -103,15 +113,14 @@ def parse_icici_pdf(lines: list[str]) -> pd.DataFrame | None:
 
                                 # 3-line: amount, amount, balance
                                 if i + 2 < len(lines):
-                                    balance_candidate = lines[i + 2].strip()
+                                    balance_candidate = lines[i + 2]
                                     balance_match = amount_regex.search(balance_candidate)
                                     if balance_match:
                                         balance_val = balance_match.group(1).replace(",", "")
                                         try:
                                             balance = float(balance_val.replace(",", ""))
                                             if not withdrawal_amt and not deposit_amt:
-                                                if parsed_rows:
-                                                    prev_balance = parsed_rows[-1].get("balance", 0) or 0
+                                                if prev_balance is not None:
                                                     if balance > prev_balance:
                                                         deposit_amt = amount_float
                                                     else:
@@ -126,8 +135,7 @@ def parse_icici_pdf(lines: list[str]) -> pd.DataFrame | None:
                                 # 2-line: amount + balance (single withdrawal or deposit column)
                                 if not withdrawal_amt and not deposit_amt:
                                     balance = next_amount_float
-                                    if parsed_rows:
-                                        prev_balance = parsed_rows[-1].get("balance", 0) or 0
+                                    if prev_balance is not None:
                                         if balance > prev_balance:
                                             deposit_amt = amount_float
                                         else:
@@ -146,26 +154,30 @@ def parse_icici_pdf(lines: list[str]) -> pd.DataFrame | None:
                         break
                 except ValueError:
                     description_parts.append(candidate)
-            else:
+            elif candidate:
                 description_parts.append(candidate)
 
             i += 1
 
         # Build transaction row
         if txn_date:
-            description = " ".join(part.strip() for part in description_parts if part.strip())
+            description = " ".join(description_parts)
 
             if withdrawal_amt is not None or deposit_amt is not None or description:
-                row: dict[str, Any] = {
-                    "txn_date": txn_date,
-                    "description": description,
-                    "withdrawal_amt": withdrawal_amt,
-                    "deposit_amt": deposit_amt,
-                    "balance": balance,
-                }
-                parsed_rows.append(row)
-
-    if not parsed_rows:
+                txn_dates.append(txn_date)
+                descriptions.append(description)
+                withdrawals.append(withdrawal_amt)
+                deposits.append(deposit_amt)
+                balances.append(balance)
+                prev_balance = balance or 0.0
+
+    if not txn_dates:
         return None
 
-    return pd.DataFrame(parsed_rows)
+    return pd.DataFrame({
+        "txn_date": txn_dates,
+        "description": descriptions,
+        "withdrawal_amt": withdrawals,
+        "deposit_amt": deposits,
+        "balance": balances,
+    })
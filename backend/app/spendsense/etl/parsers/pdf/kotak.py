@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import re
-from typing import Any
 
 import pandas as pd  # type: ignore[import-untyped]
 
+from ..common import _NO_COMMA
+from .detect import header_text
+
+# Bank names this parser requires in its lowered header window (pdf.BANK_SIGNATURES reuses it)
+SIGNATURE = re.compile(r"kotak|kkbk")
+
 # Format: DD-MM-YYYY <narration> <ref> amount(Dr/Cr) balance(Cr)
 # Can span multiple lines when narration wraps (e.g. "Recd:IMPS/.../KKBK\n/X5508/20240\nIMPS-...")
 _AMOUNT_BALANCE_RE = re.compile(
@@ -16,7 +21,7 @@ _AMOUNT_BALANCE_RE = re.compile(
 _DATE_START_RE = re.compile(r"^(\d{2}-\d{2}-\d{4})\s+")
 
 
-def parse_kotak_pdf(lines: list[str]) -> pd.DataFrame | None:
+def parse_kotak_pdf(lines: list[str], hint: str | None = None) -> pd.DataFrame | None:
     """Parse Kotak bank PDF statements.
 
     Format: DD-MM-YYYY <narration> <ref> amount(Dr/Cr) balance(Cr)
@@ -25,11 +30,15 @@ def parse_kotak_pdf(lines: list[str]) -> pd.DataFrame | None:
     if not lines:
         return None
 
-    haystack = " ".join(line.lower() for line in lines[:50])
-    if "kotak" not in haystack and "kkbk" not in haystack:
+    haystack = header_text(lines, 50, hint)
+    if not SIGNATURE.search(haystack):
         return None
 
-    parsed_rows: list[dict[str, Any]] = []
+    txn_dates: list[str] = []
+    descriptions: list[str] = []
+    withdrawals: list[float | None] = []
+    deposits: list[float | None] = []
+    balances: list[float] = []
     i = 0
 
     while i < len(lines):
@@ -40,34 +49,37 @@ def parse_kotak_pdf(lines: list[str]) -> pd.DataFrame | None:
             continue
 
         txn_date = date_match.group(1)
-        # Collect lines until we find amount(Dr/Cr) balance(Cr) at end
-        block_lines = [line]
+        # Collect lines until we find amount(Dr/Cr) balance(Cr) at end.
+        # The block is extended in place rather than re-joined from a list on every line.
+        block = line
+        match = None
         i += 1
 
+        tail = line.rstrip()  # last non-blank text of the block, where a match has to end
         while i < len(lines):
             next_line = lines[i]
             # Stop if next line starts with a date (new transaction)
             if _DATE_START_RE.match(next_line):
                 break
-            block_lines.append(next_line)
+            block += " " + next_line
             i += 1
-            # Check if this block now ends with amount balance
-            block = " ".join(block_lines)
-            if _AMOUNT_BALANCE_RE.search(block):
-                break
-
-        block = " ".join(block_lines)
-        match = _AMOUNT_BALANCE_RE.search(block)
+            tail = next_line.rstrip() or tail
+            # Check if this block now ends with amount balance; only re-scan it when it ends in "(Cr)"/"(Dr)"
+            if tail[-4:].lower() in ("(cr)", "(dr)"):
+                match = _AMOUNT_BALANCE_RE.search(block)
+                if match:
+                    break
+
+        if match is None:
+            match = _AMOUNT_BALANCE_RE.search(block)
         if not match:
             continue
 
-        amount_val = match.group(1).replace(",", "")
-        amount_dir = match.group(2).lower()
-        balance_val = match.group(3).replace(",", "")
-        balance_dir = match.group(4).lower()
+        amount_str, amount_dir, balance_str, balance_dir = match.groups()
+        # "[\d,.]+" also matches things like "1.2.3"; such rows were never transactions
         try:
-            amount_float = float(amount_val)
-            balance_float = float(balance_val)
+            amount_float = float(amount_str.translate(_NO_COMMA))
+            balance_float = float(balance_str.translate(_NO_COMMA))
         except ValueError:
             continue
 
@@ -77,21 +89,20 @@ def parse_kotak_pdf(lines: list[str]) -> pd.DataFrame | None:
         rest = _DATE_START_RE.sub("", rest, count=1).strip()
         description = rest if rest else "Transaction"
 
-        row: dict[str, Any] = {
-            "txn_date": txn_date,
-            "description": description,
-            "withdrawal_amt": None,
-            "deposit_amt": None,
-            "balance": balance_float if balance_dir == "cr" else -balance_float,
-        }
-        if amount_dir == "dr":
-            row["withdrawal_amt"] = amount_float
-        else:
-            row["deposit_amt"] = amount_float
-
-        parsed_rows.append(row)
-
-    if not parsed_rows:
+        txn_dates.append(txn_date)
+        descriptions.append(description)
+        is_debit = amount_dir.lower() == "dr"
+        withdrawals.append(amount_float if is_debit else None)
+        deposits.append(None if is_debit else amount_float)
+        balances.append(balance_float if balance_dir.lower() == "cr" else -balance_float)
+
+    if not txn_dates:
         return None
 
-    return pd.DataFrame(parsed_rows)
+    return pd.DataFrame({
+        "txn_date": txn_dates,
+        "description": descriptions,
+        "withdrawal_amt": withdrawals,
+        "deposit_amt": deposits,
+        "balance": balances,
+    })
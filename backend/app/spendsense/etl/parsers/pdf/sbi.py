@@ -4,178 +4,175 @@ from __future__ import annotations
 
 import re
 from datetime import date
-from typing import Any
 
 import pandas as pd  # type: ignore[import-untyped]
 
+from ..common import _NO_COMMA
+from .detect import header_text
+
+# Bank names this parser requires in its lowered header window (pdf.BANK_SIGNATURES reuses it)
+SIGNATURE = re.compile(r"sbi|sbin|state bank")
+
 MONTH_TO_NUM = {
     "jan": "01", "feb": "02", "mar": "03", "apr": "04", "may": "05", "jun": "06",
     "jul": "07", "aug": "08", "sep": "09", "oct": "10", "nov": "11", "dec": "12",
 }
 
-
-def parse_sbi_pdf(lines: list[str]) -> pd.DataFrame | None:
+# Statement period bounds, e.g. "1 April 2024 to 31 March 2025"
+_YEAR_START_RE = re.compile(r"(?:1\s+)?(?:April|Apr)\s+(\d{4})", re.I)
+_YEAR_END_RE = re.compile(r"(?:31\s+)?(?:March|Mar)\s+(\d{4})", re.I)
+_DATE_RE = re.compile(
+    r"^(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})\b",
+    re.I,
+)
+# Line ending with AMOUNT BALANCE (last two numbers)
+_AMOUNT_BALANCE_RE = re.compile(r"^(.+?)\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)\s*$")
+# Page markers and table headers (one alternation, anchored via .match)
+_SKIP_RE = re.compile(
+    r"(?-i:--\s+\d+\s+of\s+\d+\s+--\s*$)"
+    r"|Txn\s+Date\s+Value\s*$"
+    r"|Date\s+Description\s+Ref"
+    r"|No\.\s+Debit\s+Credit"
+    r"|Balance\s*$",
+    re.I,
+)
+# First characters a _SKIP_RE line can start with; most lines (dates, amounts, refs) fail this before the regex
+_SKIP_FIRST_CHARS = frozenset("-TtDdNnBb")
+
+# parse_sbi_pdf states: before the first date line, after a date line without an amount, after the amount
+_SEEKING_DATE, _SEEKING_AMOUNT, _COLLECTING_DESC = range(3)
+
+
+def _is_credit(desc: str) -> bool:
+    """Direction from an SBI narration: transfer/sweep/UPI/NEFT/IMPS credits, or "credit" without a leading "debit".
+
+    One lower() and plain substring checks: for this handful of short phrases, str's C search is several times
+    faster than a regex alternation (an IGNORECASE one also loses its literal-prefix scan).
+    """
+    lower = desc.lower()
+    if "by transfer" in lower or "transfer credit" in lower or "sweep from" in lower:
+        return True
+    if "credit" in lower and "debit" not in lower[:30]:
+        return True
+    if "upi/cr" in lower or "upi cr" in lower:
+        return True
+    if "neft" in lower and "from" in lower:
+        return True
+    return "imps" in lower and "transfer from" in lower
+
+
+def parse_sbi_pdf(lines: list[str], hint: str | None = None) -> pd.DataFrame | None:
     """Parse SBI PDF statements. Handles both single-line txns and multi-line description + amount."""
     if not lines:
         return None
 
-    haystack = " ".join(lines[:100]).lower()
-    if "sbi" not in haystack and "sbin" not in haystack and "state bank" not in haystack:
+    haystack = header_text(lines, 100, hint)
+    if not SIGNATURE.search(haystack):
         return None
     if "account statement from" not in haystack and "txn date" not in haystack:
         return None
 
+    # Strip once up front; the stages below look at each line several times
+    lines = [line.strip() for line in lines]
+
     # Infer year from statement period
     start_year, end_year = 2024, 2025
     for line in lines[:60]:
-        m = re.search(r"(?:1\s+)?(?:April|Apr)\s+(\d{4})", line, re.I)
+        m = _YEAR_START_RE.search(line)
         if m:
             start_year = int(m.group(1))
             break
     for line in lines[:60]:
-        m = re.search(r"(?:31\s+)?(?:March|Mar)\s+(\d{4})", line, re.I)
+        m = _YEAR_END_RE.search(line)
         if m:
             end_year = int(m.group(1))
             break
 
-    date_full_regex = re.compile(
-        r"^(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})\b",
-        re.I,
-    )
-    # Line ending with AMOUNT BALANCE (last two numbers)
-    amount_balance_regex = re.compile(r"^(.+?)\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)\s*$")
-
-    def _skip_line(s: str) -> bool:
-        return bool(
-            re.match(r"^--\s+\d+\s+of\s+\d+\s+--\s*$", s)
-            or re.match(r"^Txn\s+Date\s+Value\s*$", s, re.I)
-            or re.match(r"^Date\s+Description\s+Ref", s, re.I)
-            or re.match(r"^No\.\s+Debit\s+Credit", s, re.I)
-            or re.match(r"^Balance\s*$", s, re.I)
-        )
-
-    def _is_credit(desc: str) -> bool:
-        lower = desc.lower()
-        if "by transfer" in lower or "transfer credit" in lower:
-            return True
-        if "sweep from" in lower:
-            return True
-        if "credit" in lower and "debit" not in lower[:30]:
-            return True
-        if "upi/cr" in lower or "upi cr" in lower:
-            return True
-        if "neft" in lower and "from" in lower:
-            return True
-        if "imps" in lower and "transfer from" in lower:
-            return True
-        return False
-
-    parsed_rows: list[dict[str, Any]] = []
-    i = 0
-
-    while i < len(lines):
-        line = lines[i].strip()
-
-        if _skip_line(line):
-            i += 1
+    txn_dates: list[date] = []
+    descriptions: list[str] = []
+    withdrawals: list[float | None] = []
+    deposits: list[float | None] = []
+
+    # One forward pass; each line is classified once and drives the state of the open transaction
+    state = _SEEKING_DATE
+    txn_date: date | None = None
+    description_parts: list[str] = []
+    withdrawal_amt: float | None = None
+    deposit_amt: float | None = None
+
+    for line in lines:
+        if line[:1] in _SKIP_FIRST_CHARS and _SKIP_RE.match(line):
             continue
 
-        date_match = date_full_regex.search(line)
-        if not date_match:
-            i += 1
+        date_match = _DATE_RE.match(line)
+        if date_match:
+            # A date line closes the open transaction; ones that never got an amount are dropped
+            if withdrawal_amt is not None or deposit_amt is not None:
+                txn_dates.append(txn_date)
+                descriptions.append(" ".join(p for p in description_parts if p))
+                withdrawals.append(withdrawal_amt)
+                deposits.append(deposit_amt)
+
+            day = int(date_match.group(1))
+            mon = MONTH_TO_NUM.get(date_match.group(2).lower(), "01")
+            year = int(date_match.group(3))
+            txn_date = date(year, int(mon), day)
+            after_date = line[date_match.end():].strip()
+            description_parts = []
+            withdrawal_amt = deposit_amt = None
+
+            # Case 1: Amount and balance on same line: "... DESC AMOUNT BALANCE"
+            # "[\d,]+\.?\d*" only fails float() when it holds no digit (just commas/dots); test that up front
+            ab_match = _AMOUNT_BALANCE_RE.match(after_date)
+            if ab_match:
+                prefix = ab_match.group(1).strip()
+                amount_str = ab_match.group(2)
+                if amount_str.strip(",."):
+                    amount_float = float(amount_str.translate(_NO_COMMA))
+                    if prefix:
+                        description_parts.append(prefix)
+                    if _is_credit(prefix):
+                        deposit_amt = amount_float
+                    else:
+                        withdrawal_amt = amount_float
+                else:
+                    description_parts.append(after_date)
+                state = _COLLECTING_DESC
+            else:
+                # Case 2: Description on this line, amount on next line(s)
+                if after_date:
+                    description_parts.append(after_date)
+                state = _SEEKING_AMOUNT
             continue
 
-        day = int(date_match.group(1))
-        mon = MONTH_TO_NUM.get(date_match.group(2).lower(), "01")
-        year = int(date_match.group(3))
-        txn_date = date(year, int(mon), day)
-        after_date = line[date_match.end():].strip()
-
-        withdrawal_amt: float | None = None
-        deposit_amt: float | None = None
-        description_parts: list[str] = []
-
-        # Case 1: Amount and balance on same line: "... DESC AMOUNT BALANCE"
-        ab_match = amount_balance_regex.match(after_date)
-        if ab_match:
-            prefix = ab_match.group(1).strip()
-            amount_val = ab_match.group(2).replace(",", "")
-            try:
-                amount_float = float(amount_val)
-                if prefix:
-                    description_parts.append(prefix)
-                if _is_credit(prefix):
+        if state == _SEEKING_AMOUNT:
+            # Amount line: "REF AMOUNT BALANCE" or "AMOUNT BALANCE"
+            amt_match = _AMOUNT_BALANCE_RE.match(line)
+            if amt_match and amt_match.group(2).strip(",."):
+                amount_float = float(amt_match.group(2).translate(_NO_COMMA))
+                if _is_credit(" ".join(description_parts)):
                     deposit_amt = amount_float
                 else:
                     withdrawal_amt = amount_float
-                i += 1
-            except ValueError:
-                description_parts.append(after_date)
-                i += 1
-        else:
-            # Case 2: Description on this line, amount on next line(s)
-            if after_date:
-                description_parts.append(after_date)
-            i += 1
-
-            while i < len(lines):
-                candidate = lines[i].strip()
-
-                if date_full_regex.match(candidate):
-                    break
-
-                if _skip_line(candidate):
-                    i += 1
-                    continue
-
-                # Amount line: "REF AMOUNT BALANCE" or "AMOUNT BALANCE"
-                amt_match = amount_balance_regex.match(candidate)
-                if amt_match:
-                    amount_val = amt_match.group(2).replace(",", "")
-                    try:
-                        amount_float = float(amount_val)
-                        desc = " ".join(description_parts)
-                        if _is_credit(desc):
-                            deposit_amt = amount_float
-                        else:
-                            withdrawal_amt = amount_float
-                        i += 1
-                        break
-                    except ValueError:
-                        pass
-
-                if candidate:
-                    description_parts.append(candidate)
-                i += 1
-
-        # Collect description continuations (lines before next date line)
-        while i < len(lines):
-            candidate = lines[i].strip()
-            if date_full_regex.match(candidate):
-                break
-            if _skip_line(candidate):
-                i += 1
-                continue
-            # Don't consume if it looks like an amount line for NEXT txn - that would have been consumed
-            description_parts.append(candidate)
-            i += 1
-
-        if withdrawal_amt is not None or deposit_amt is not None:
-            description = " ".join(p.strip() for p in description_parts if p.strip())
-            parsed_rows.append({
-                "txn_date": txn_date,
-                "description": description,
-                "withdrawal_amt": withdrawal_amt,
-                "deposit_amt": deposit_amt,
-            })
-        else:
-            # We consumed lines but didn't get amount - need to not advance for continuations
-            # Actually we already advanced. The continuations we collected might belong to prev txn.
-            # This is a bug: when we have Case 2 and never find amount, we incorrectly consume.
-            # For now, skip - we'll miss some txns. Could fix by not consuming until we have amount.
-            pass
-
-    if not parsed_rows:
+                state = _COLLECTING_DESC
+            elif line:
+                description_parts.append(line)
+        elif state == _COLLECTING_DESC:
+            # Description continuations (lines before next date line)
+            description_parts.append(line)
+
+    if withdrawal_amt is not None or deposit_amt is not None:
+        txn_dates.append(txn_date)
+        descriptions.append(" ".join(p for p in description_parts if p))
+        withdrawals.append(withdrawal_amt)
+        deposits.append(deposit_amt)
+
+    if not txn_dates:
         return None
 
-    return pd.DataFrame(parsed_rows)
+    return pd.DataFrame({
+        "txn_date": txn_dates,
+        "description": descriptions,
+        "withdrawal_amt": withdrawals,
+        "deposit_amt": deposits,
+    })
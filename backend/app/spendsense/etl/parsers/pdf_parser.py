@@ -2,30 +2,55 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
 import logging
+import multiprocessing
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any
 
-import pdfplumber  # type: ignore[import-untyped]
-from pdfplumber.utils.exceptions import PdfminerException  # type: ignore[import-untyped]
-
-try:
-    from pdfminer.pdfdocument import PDFPasswordIncorrect as PDFPasswordError  # type: ignore[import-untyped]
-except ImportError:
-    PDFPasswordError = Exception  # type: ignore[assignment]
+# pdfplumber/pdfminer and PyMuPDF (fitz) are imported inside the functions that use them, so importing
+# the parsers package (e.g. for CSV/Excel uploads) doesn't pay for them; Python caches them after first use.
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
 
 try:
-    import fitz  # type: ignore[import-untyped]
+    import pyarrow as pa  # type: ignore[import-untyped]
 except ImportError:
-    fitz = None  # type: ignore[assignment]
-
-import pandas as pd  # type: ignore[import-untyped]
+    pa = None  # type: ignore[assignment]
 
 from .common import SpendSenseParseError, dataframe_to_records, infer_bank_code, structure_dataframe
-from .pdf import BANK_PARSERS
+from .pdf import BANK_PARSERS, BANK_SIGNATURES
+from .pdf.detect import bank_hint, header_text
 
 logger = logging.getLogger(__name__)
 
+
+def _pdf_password_error() -> type[Exception]:
+    """pdfminer's wrong/missing-password exception (plain Exception if this pdfminer lacks it)."""
+    try:
+        from pdfminer.pdfdocument import PDFPasswordIncorrect  # type: ignore[import-untyped]
+    except ImportError:
+        return Exception
+    return PDFPasswordIncorrect
+
+
+# Parsed records of recent uploads, keyed by a digest of content and password plus the filename. Re-uploads
+# of the same statement (retries, re-imports) skip extraction. Kept in memory only: statement contents and
+# passwords are never written to disk, and the key holds no password. Bounded LRU, shared across threads.
+_RESULT_CACHE_SIZE = 32
+_result_cache: OrderedDict[tuple[bytes, str], tuple[dict[str, Any], ...]] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# Upper bound on processes used to extract tables from one PDF's pages
+MAX_PAGE_WORKERS = 8
+
 TABLE_SETTING_PRESETS: list[dict[str, Any] | None] = [
     None,  # default behaviour
     {
@@ -58,50 +83,128 @@ TABLE_SETTING_PRESETS: list[dict[str, Any] | None] = [
 ]
 
 
-def _extract_pdf_tables(buffer: io.BytesIO, password: str | None = None) -> pd.DataFrame:
+def _best_page_rows(page: Any) -> tuple[list[list[str]], int | None]:
+    """Run the table presets on one page; return the rows of the best preset and its index."""
+    best_rows: list[list[str]] = []
+    best_preset_idx: int | None = None
+    line_count: int | None = None
+
+    for preset_idx, settings in enumerate(TABLE_SETTING_PRESETS):
+        if settings is None:
+            tables = page.extract_tables() or []
+        else:
+            tables = page.extract_tables(table_settings=settings) or []
+
+        # Cells cleaned to stripped strings ("" for None); rows with no text are dropped
+        page_rows: list[list[str]] = [
+            cleaned_row
+            for table in tables
+            if table
+            for raw_row in table
+            if raw_row and any(cleaned_row := ["" if cell is None else str(cell).strip() for cell in raw_row])
+        ]
+
+        if len(page_rows) > len(best_rows):
+            best_rows = page_rows
+            best_preset_idx = preset_idx
+
+        # A preset with a row for every text line can't be beaten; skip the remaining layout passes
+        if best_rows and preset_idx < len(TABLE_SETTING_PRESETS) - 1:
+            if line_count is None:
+                line_count = sum(1 for line in (page.extract_text() or "").splitlines() if line.strip())
+            if len(best_rows) >= line_count:
+                break
+
+    return best_rows, best_preset_idx
+
+
+def _iter_best_page_rows(pages: list[Any]) -> Iterator[tuple[list[list[str]], int | None]]:
+    for page in pages:
+        result = _best_page_rows(page)
+        # Drop the page's cached layout objects (chars, words, ...) before moving on
+        page.close()
+        yield result
+
+
+# PDF bytes and password for page workers, set once per worker process by the pool initializer
+_page_worker_source: tuple[bytes, str | None] | None = None
+
+
+def _init_page_worker(data: bytes, password: str | None) -> None:
+    global _page_worker_source
+    _page_worker_source = (data, password)
+
+
+def _best_page_rows_at(page_index: int) -> tuple[list[list[str]], int | None]:
+    """Page worker: open just one page of the PDF and run the presets on it."""
+    import pdfplumber  # type: ignore[import-untyped]
+
+    assert _page_worker_source is not None
+    data, password = _page_worker_source
+    with pdfplumber.open(io.BytesIO(data), password=password, pages=[page_index + 1]) as pdf:
+        return _best_page_rows(pdf.pages[0])
+
+
+def _in_worker_process() -> bool:
+    """True inside a pool or daemon worker (e.g. Celery prefork), where starting child processes fails."""
+    return multiprocessing.current_process().daemon or multiprocessing.parent_process() is not None
+
+
+def _page_workers(total_pages: int, requested: int = 1) -> int:
+    """Worker processes for per-page table extraction: 1 (serial) unless the caller asked for more.
+
+    Page pools fork the calling process, which can deadlock a child when other threads hold locks at fork
+    time (FastAPI handlers, the Gmail Pub/Sub subscriber). Only callers known to be single-threaded, such
+    as CLI scripts, should opt in. Always serial inside pool or daemon workers.
+    """
+    if requested <= 1 or _in_worker_process():
+        return 1
+    return min(requested, MAX_PAGE_WORKERS, os.cpu_count() or 1, total_pages)
+
+
+def _best_page_rows_parallel(
+    data: bytes, password: str | None, total_pages: int, workers: int
+) -> list[tuple[list[list[str]], int | None]] | None:
+    """Run the presets on every page across worker processes, in page order. None if no pool could run."""
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_page_worker, initargs=(data, password)
+        ) as pool:
+            return list(pool.map(_best_page_rows_at, range(total_pages)))
+    except (BrokenProcessPool, OSError) as exc:
+        logger.warning("Parallel PDF table extraction unavailable, extracting pages serially: %s", exc)
+        return None
+
+
+def _extract_pdf_tables(data: bytes, password: str | None = None, page_workers: int = 1) -> pd.DataFrame:
     """Extract tables from PDF. Tries all presets per page and keeps the result with max rows.
 
     Plan fix: Previously the first preset that returned tables won; that preset often
     produces merged cells (one date spanning many rows). Now we try all presets and
-    choose the one yielding the most data rows per page.
+    choose the one yielding the most data rows per page. The remaining presets are skipped
+    once one yields at least as many rows as the page has text lines. Pages are independent,
+    so with page_workers > 1 multi-page PDFs are spread over worker processes (see _page_workers).
     """
+    import pdfplumber  # type: ignore[import-untyped]
+    from pdfplumber.utils.exceptions import PdfminerException  # type: ignore[import-untyped]
+
+    PDFPasswordError = _pdf_password_error()
     all_rows: list[list[str]] = []
+    max_cols = 0  # widest row so far, so the final frame can be allocated once
     total_pages = 0
     pages_with_tables = 0
 
     try:
-        with pdfplumber.open(buffer, password=password) as pdf:
+        with pdfplumber.open(io.BytesIO(data), password=password) as pdf:
             total_pages = len(pdf.pages)
-            for page_num, page in enumerate(pdf.pages, 1):
-                best_rows: list[list[str]] = []
-                best_preset_idx: int | None = None
-
-                for preset_idx, settings in enumerate(TABLE_SETTING_PRESETS):
-                    if settings is None:
-                        tables = page.extract_tables() or []
-                    else:
-                        tables = page.extract_tables(table_settings=settings) or []
-
-                    page_rows: list[list[str]] = []
-                    for table in tables:
-                        if not table:
-                            continue
-                        for raw_row in table:
-                            if not raw_row:
-                                continue
-                            cleaned_row: list[str] = []
-                            for cell in raw_row:
-                                if cell is None:
-                                    cleaned_row.append("")
-                                else:
-                                    cleaned_row.append(str(cell).strip())
-                            if any(value for value in cleaned_row):
-                                page_rows.append(cleaned_row)
-
-                    if len(page_rows) > len(best_rows):
-                        best_rows = page_rows
-                        best_preset_idx = preset_idx
-
+            page_results: Iterable[tuple[list[list[str]], int | None]] | None = None
+            workers = _page_workers(total_pages, page_workers)
+            if workers > 1:
+                page_results = _best_page_rows_parallel(data, password, total_pages, workers)
+            if page_results is None:
+                page_results = _iter_best_page_rows(pdf.pages)
+
+            for page_num, (best_rows, best_preset_idx) in enumerate(page_results, 1):
                 if best_rows:
                     pages_with_tables += 1
                     logger.debug(
@@ -111,6 +214,7 @@ def _extract_pdf_tables(buffer: io.BytesIO, password: str | None = None) -> pd.D
                         len(best_rows),
                     )
                     all_rows.extend(best_rows)
+                    max_cols = max(max_cols, max(len(row) for row in best_rows))
     except PDFPasswordError:
         if password:
             raise SpendSenseParseError("Incorrect PDF password. Please re-enter and try again.")
@@ -132,25 +236,31 @@ def _extract_pdf_tables(buffer: io.BytesIO, password: str | None = None) -> pd.D
         raise SpendSenseParseError(error_msg)
 
     logger.info("PDF table extraction: %d total rows from %d pages", len(all_rows), pages_with_tables)
-    max_cols = max(len(row) for row in all_rows)
-    normalized_rows = [row + [""] * (max_cols - len(row)) for row in all_rows]
-    return pd.DataFrame(normalized_rows)
-
-
-def _extract_lines_with_pdfplumber(buffer: io.BytesIO, password: str | None = None) -> list[str] | None:
+    # Pad short rows in place in one preallocated array rather than building a padded copy of every row
+    cells = np.full((len(all_rows), max_cols), "", dtype=object)
+    for i, row in enumerate(all_rows):
+        cells[i, : len(row)] = row
+    if pa is None:
+        return pd.DataFrame(cells)
+    # Arrow string columns: one contiguous buffer per column instead of a Python str object per cell
+    table = pa.table({str(j): pa.array(cells[:, j], type=pa.string()) for j in range(max_cols)})
+    frame = table.to_pandas(types_mapper=pd.ArrowDtype)
+    frame.columns = pd.RangeIndex(max_cols)
+    return frame
+
+
+def _extract_lines_with_pdfplumber(data: bytes, password: str | None = None) -> list[str] | None:
     """Extract text lines using pdfplumber (already handles password-protected PDFs)."""
-    buffer.seek(0)
+    import pdfplumber  # type: ignore[import-untyped]
+
     try:
-        with pdfplumber.open(buffer, password=password) as pdf:
+        with pdfplumber.open(io.BytesIO(data), password=password) as pdf:
             lines: list[str] = []
             total_text_length = 0
             for page in pdf.pages:
                 text = page.extract_text() or ""
                 total_text_length += len(text)
-                for line in text.splitlines():
-                    stripped = line.strip()
-                    if stripped:
-                        lines.append(stripped)
+                lines.extend([stripped for line in text.splitlines() if (stripped := line.strip())])
             if total_text_length < 100 and len(lines) < 10:
                 return None
             return lines if lines else None
@@ -158,12 +268,63 @@ def _extract_lines_with_pdfplumber(buffer: io.BytesIO, password: str | None = No
         return None
 
 
-def _extract_lines_with_pymupdf(buffer: io.BytesIO, password: str | None = None) -> list[str] | None:
-    if fitz is None:
+# Vertical distance (points) within which PyMuPDF words share a text line, as pdfplumber's extract_text y_tolerance
+_LINE_Y_TOLERANCE = 3
+
+
+def _page_lines_by_baseline(page: Any) -> list[str]:
+    """Text lines of a PyMuPDF page laid out like pdfplumber's extract_text.
+
+    get_text("blocks") splits a table row into one block per cell; grouping words by their top coordinate
+    instead puts the whole row on one line, which is what the line-based bank parsers expect.
+    """
+    words = sorted(page.get_text("words"), key=lambda w: w[1])
+    rows: list[list[Any]] = []
+    for word in words:
+        # Measured from the row's first (topmost) word, so a slight skew can't chain two rows together
+        if rows and word[1] - rows[-1][0][1] <= _LINE_Y_TOLERANCE:
+            rows[-1].append(word)
+        else:
+            rows.append([word])
+    lines: list[str] = []
+    for row in rows:
+        row.sort(key=lambda w: w[0])
+        line = " ".join(w[4] for w in row).strip()
+        if line:
+            lines.append(line)
+    return lines
+
+
+# An amount followed by a balance, e.g. "1,999.00 623.40" or Kotak's "80.00(Dr) 298.31(Cr)"
+_AMOUNT = r"-?[\d,]*\d\.\d{2}(?:\((?:Cr|Dr)\))?"
+_AMOUNT_PAIR_RE = re.compile(rf"(?<!\S){_AMOUNT}\s+{_AMOUNT}(?!\S)")
+_AMOUNTS_ONLY_RE = re.compile(rf"^{_AMOUNT}(?:\s+{_AMOUNT})*$")
+
+
+def _baseline_rows_look_intact(lines: list[str]) -> bool:
+    """False when baseline grouping looks to have merged two table rows or split one.
+
+    A merged row leaves two amount-and-balance pairs on one line; a split row leaves its amounts on a line
+    of their own. Neither occurs in the sample statements, so such lines send the parse to pdfplumber.
+    """
+    for line in lines:
+        if _AMOUNTS_ONLY_RE.match(line):
+            return False
+        m = _AMOUNT_PAIR_RE.search(line)
+        if m and _AMOUNT_PAIR_RE.search(line, m.end()):
+            return False
+    return True
+
+
+def _extract_lines_with_pymupdf(data: bytes, password: str | None = None, by_baseline: bool = False) -> list[str] | None:
+    """Extract text lines using PyMuPDF, block by block or (by_baseline) row by row like pdfplumber."""
+    try:
+        import fitz  # type: ignore[import-untyped]
+    except ImportError:
         return None
-    buffer.seek(0)
     try:
-        doc = fitz.open(stream=buffer.read(), filetype="pdf")
+        # PyMuPDF keeps a reference to the bytes and MuPDF reads them in place via fz_open_memory (no copy)
+        doc = fitz.open(stream=data, filetype="pdf")
     except Exception:
         return None
 
@@ -182,13 +343,23 @@ def _extract_lines_with_pymupdf(buffer: io.BytesIO, password: str | None = None)
     lines: list[str] = []
     total_text_length = 0
     try:
-        for page in doc:
-            text = page.get_text("text") or ""
-            total_text_length += len(text)
-            for line in text.splitlines():
-                stripped = line.strip()
-                if stripped:
-                    lines.append(stripped)
+        for page_index in range(doc.page_count):
+            page = doc.load_page(page_index)
+            if by_baseline:
+                page_lines = _page_lines_by_baseline(page)
+                total_text_length += sum(len(line) for line in page_lines)
+                lines.extend(page_lines)
+                page = None
+                continue
+            # Text blocks carry the same lines as get_text("text") without building the page-wide string;
+            # block[6] is 0 for text and 1 for image placeholders, which "text" mode leaves out
+            for block in page.get_text("blocks"):
+                if block[6] != 0:
+                    continue
+                text = block[4]
+                total_text_length += len(text)
+                lines.extend([stripped for line in text.splitlines() if (stripped := line.strip())])
+            page = None  # release the page before loading the next one
     except ValueError as e:
         doc.close()
         if "encrypted" in str(e).lower() or "closed" in str(e).lower():
@@ -205,72 +376,156 @@ def _extract_lines_with_pymupdf(buffer: io.BytesIO, password: str | None = None)
     return lines if lines else None
 
 
-def parse_pdf_file(data: bytes, filename: str, password: str | None = None) -> list[dict[str, Any]]:
-    """Parse PDF bank statement into normalized transaction records."""
-    buffer = io.BytesIO(data)
+def _extract_lines(data: bytes, password: str | None = None) -> list[str] | None:
+    """Text lines via pdfplumber (handles password-protected PDFs), falling back to PyMuPDF."""
+    lines = _extract_lines_with_pdfplumber(data, password=password)
+    if not lines:
+        lines = _extract_lines_with_pymupdf(data, password=password)
+    return lines
+
+
+def _result_cache_digest(data: bytes, password: str | None) -> bytes:
+    """sha256 over the password and the PDF bytes, so cache keys never carry the password itself."""
+    digest = hashlib.sha256()
+    if password is None:
+        digest.update(b"\x00")
+    else:
+        # Length-prefixed so no (password, data) pair can produce the same byte stream as another
+        secret = password.encode("utf-8", "surrogatepass")
+        digest.update(b"\x01" + len(secret).to_bytes(8, "big") + secret)
+    digest.update(data)
+    return digest.digest()
+
+
+def parse_pdf_file(
+    data: bytes, filename: str, password: str | None = None, *, page_workers: int = 1
+) -> list[dict[str, Any]]:
+    """Parse PDF bank statement into normalized transaction records.
+
+    Results are cached in memory per (content, filename, password); callers get fresh dict copies.
+    page_workers > 1 extracts tables from several pages in worker processes; only single-threaded
+    callers (CLI scripts) should pass it.
+    """
+    key = (_result_cache_digest(data, password), filename)
+    with _result_cache_lock:
+        cached = _result_cache.get(key)
+        if cached is not None:
+            _result_cache.move_to_end(key)
+    if cached is not None:
+        logger.info("Using cached parse of %s (%d transactions)", filename, len(cached))
+        return [dict(record) for record in cached]
+
+    records = _parse_pdf_file(data, filename, password, page_workers)
+    with _result_cache_lock:
+        _result_cache[key] = tuple(dict(record) for record in records)
+        while len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+    return records
+
+
+# Banks whose statements go to their line-based parser first (value: BANK_PARSERS name)
+_LINE_BASED_BANKS = {"sbi_bank": "SBI", "canara_bank": "Canara", "axis_bank": "Axis", "kotak_bank": "Kotak", "federal_bank": "Federal"}
+# Line-based banks whose parsers give the same records from PyMuPDF's baseline-grouped lines as from
+# pdfplumber's on the sample statements (test_pdf_pymupdf_first.py), apart from the "(cid:N)" placeholders
+# pdfplumber leaves for unmapped glyphs. The others (Axis, Federal) always use pdfplumber's lines.
+_PYMUPDF_FIRST_BANKS = frozenset({"sbi_bank", "canara_bank", "kotak_bank"})
+
+
+def _parse_bank_lines(lines: list[str], hint: str, bank_code: str, filename: str) -> list[dict[str, Any]] | None:
+    """Run bank_code's line-based parser; records, or None when it finds no transactions."""
+    target = _LINE_BASED_BANKS[bank_code]
+    for bank_name, parser in BANK_PARSERS:
+        if bank_name == target:
+            try:
+                # Pass force=True when bank_code is already known, so parser skips bank name check
+                if bank_code == "federal_bank":
+                    df = parser(lines, force=True, hint=hint)
+                else:
+                    df = parser(lines, hint=hint)
+                if df is not None and not df.empty:
+                    logger.info("Parsed %s using %s line-based parser (%d transactions)", filename, target, len(df))
+                    return dataframe_to_records(df, bank_code=bank_code)
+                if df is not None and df.empty:
+                    logger.warning("%s parser returned empty for %s, falling back to table extraction", target, filename)
+                else:
+                    # df is None - parser didn't recognize the format
+                    logger.debug("%s parser returned None for %s (format not recognized or no transactions found)", target, filename)
+            except Exception as e:
+                logger.warning("%s parser failed for %s: %s", target, filename, e)
+            break
+    return None
+
+
+def _parse_pdf_file(
+    data: bytes, filename: str, password: str | None = None, page_workers: int = 1
+) -> list[dict[str, Any]]:
     bank_code = infer_bank_code(filename)
     lines: list[str] | None = None
+    lines_extracted = False  # text extraction is deterministic, so it runs at most once per upload
+    hint: str | None = None  # bank_hint(lines), built once and shared by inference and the parsers
 
     # If filename doesn't hint the bank, extract text and infer from content (headers often have bank name)
     if not bank_code:
-        lines = _extract_lines_with_pdfplumber(buffer, password=password)
-        if not lines:
-            lines = _extract_lines_with_pymupdf(buffer, password=password)
+        lines = _extract_lines(data, password)
+        lines_extracted = True
         if lines:
-            sample = " ".join(lines[:80])  # Headers/footers usually in first pages
+            hint = bank_hint(lines)
+            sample = header_text(lines, 80, hint)  # Headers/footers usually in first pages
             bank_code = infer_bank_code(filename, sample_text=sample)
-            buffer.seek(0)
 
     # SBI, Canara, Axis, Kotak, Federal: table extraction often wrong (header row = account names). Prefer text-based parsers.
-    if bank_code in ("sbi_bank", "canara_bank", "axis_bank", "kotak_bank", "federal_bank"):
+    if bank_code in _LINE_BASED_BANKS:
         logger.info("Using line-based parser for %s (bank=%s)", filename, bank_code)
-        if not lines:
-            lines = _extract_lines_with_pdfplumber(buffer, password=password)
-        if not lines:
-            lines = _extract_lines_with_pymupdf(buffer, password=password)
+        if not lines_extracted and bank_code in _PYMUPDF_FIRST_BANKS:
+            # PyMuPDF's lines, grouped by baseline like pdfplumber's, are much cheaper than pdfplumber's layout
+            # pass; pdfplumber only runs when they are missing, look mis-grouped or the parser finds nothing in them
+            try:
+                fast_lines = _extract_lines_with_pymupdf(data, password, by_baseline=True)
+            except SpendSenseParseError:
+                raise
+            except Exception as e:
+                logger.debug("PyMuPDF line extraction failed for %s: %s", filename, e)
+                fast_lines = None
+            if fast_lines and not _baseline_rows_look_intact(fast_lines):
+                logger.info("PyMuPDF lines of %s look mis-grouped, using pdfplumber", filename)
+                fast_lines = None
+            if fast_lines:
+                records = _parse_bank_lines(fast_lines, bank_hint(fast_lines), bank_code, filename)
+                if records is not None:
+                    return records
+        if not lines_extracted:
+            lines = _extract_lines(data, password)
+            lines_extracted = True
         if lines:
-            parser_map = {"sbi_bank": "SBI", "canara_bank": "Canara", "axis_bank": "Axis", "kotak_bank": "Kotak", "federal_bank": "Federal"}
-            target = parser_map.get(bank_code)
-            if target:
-                for bank_name, parser in BANK_PARSERS:
-                    if bank_name == target:
-                        try:
-                            # Pass force=True when bank_code is already known, so parser skips bank name check
-                            if bank_code == "federal_bank":
-                                df = parser(lines, force=True)
-                            else:
-                                df = parser(lines)
-                            if df is not None and not df.empty:
-                                logger.info("Parsed %s using %s line-based parser (%d transactions)", filename, target, len(df))
-                                return dataframe_to_records(df, bank_code=bank_code)
-                            if df is not None and df.empty:
-                                logger.warning("%s parser returned empty for %s, falling back to table extraction", target, filename)
-                            else:
-                                # df is None - parser didn't recognize the format
-                                logger.debug("%s parser returned None for %s (format not recognized or no transactions found)", target, filename)
-                        except Exception as e:
-                            logger.warning("%s parser failed for %s: %s", target, filename, e)
-                        break
-        buffer.seek(0)
+            if hint is None:
+                hint = bank_hint(lines)
+            records = _parse_bank_lines(lines, hint, bank_code, filename)
+            if records is not None:
+                return records
 
     try:
-        df_raw = _extract_pdf_tables(buffer, password)
+        df_raw = _extract_pdf_tables(data, password, page_workers)
         logger.debug("parse_pdf_file: extracted %d raw rows from tables", len(df_raw))
         df = structure_dataframe(df_raw, is_pdf=True)
         return dataframe_to_records(df, bank_code=bank_code)
     except SpendSenseParseError as primary_error:
         logger.info("Table extraction failed for %s, attempting text extraction fallback: %s", filename, primary_error)
-        # Try pdfplumber first (handles password-protected PDFs); then PyMuPDF
-        lines = _extract_lines_with_pdfplumber(buffer, password=password)
-        if not lines:
-            lines = _extract_lines_with_pymupdf(buffer, password=password)
+        # Reuse the lines from bank inference / the line-based attempt when there were any
+        if not lines_extracted:
+            lines = _extract_lines(data, password)
         if lines:
             logger.info("Extracted %d lines from PDF, trying bank-specific parsers", len(lines))
             # When filename doesn't hint the bank, infer_bank_code is None. Use parser's bank.
             _PARSER_TO_CODE = {"Axis": "axis_bank", "SBI": "sbi_bank", "Canara": "canara_bank", "HDFC": "hdfc_bank", "ICICI": "icici_bank", "Kotak": "kotak_bank", "Federal": "federal_bank"}
+            if hint is None:
+                hint = bank_hint(lines)  # lowered header shared by every parser's bank check
             for bank_name, parser in BANK_PARSERS:
+                # Parsers whose bank name isn't anywhere in the header window would only return None
+                signature = BANK_SIGNATURES.get(bank_name)
+                if signature is not None and not signature.search(hint):
+                    continue
                 try:
-                    df = parser(lines)
+                    df = parser(lines, hint=hint)
                     if df is not None and not df.empty:
                         logger.info("Successfully parsed %s using %s parser", filename, bank_name)
                         effective_bank_code = bank_code or _PARSER_TO_CODE.get(bank_name)
@@ -0,0 +1,64 @@
+"""
+Unit tests for bank-parser dispatch in parsers.excel_parser.parse_excel_file.
+
+Covers: registry-order priority when filename and sheet content name different banks, fall-through on errors.
+"""
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import pytest
+
+from app.spendsense.etl.parsers import excel_parser
+from app.spendsense.etl.parsers.common import infer_bank_code
+
+# Filename says ICICI, but the first rows carry an HDFC IFSC, so infer_bank_code picks hdfc_bank
+FILENAME = "ICICI_statement.csv"
+CSV_BYTES = (
+    b"Account,IFSC,,\n"
+    b"123456,hdfc0001234,,\n"
+    b"Date,Narration,Withdrawal,Deposit\n"
+    b"01/04/2025,UPI-TEST,10.00,\n"
+)
+
+
+@pytest.fixture
+def parser_calls(monkeypatch):
+    """Stub ICICI/HDFC parsers in registry order; the ICICI one fails unless told otherwise."""
+    calls = []
+    icici_fails = {"value": True}
+
+    def icici(df_raw, filename):
+        calls.append("ICICI")
+        if icici_fails["value"]:
+            raise ValueError("layout not recognised")
+        return [{"parser": "ICICI"}]
+
+    def hdfc(df_raw, filename):
+        calls.append("HDFC")
+        return [{"parser": "HDFC"}]
+
+    monkeypatch.setattr(excel_parser, "BANK_EXCEL_PARSERS", [("ICICI", "icici", icici), ("HDFC", "hdfc", hdfc)])
+    return calls, icici_fails
+
+
+def test_conflicting_filename_and_sample_infer_hdfc():
+    """Precondition: the sample's IFSC wins in infer_bank_code, because "hdfc" is checked before "icici"."""
+    assert infer_bank_code(FILENAME, "123456 hdfc0001234") == "hdfc_bank"
+
+
+def test_filename_match_tried_first_in_registry_order(parser_calls):
+    """ICICI (filename) comes before HDFC (bank code) in the registry and wins when it parses."""
+    calls, icici_fails = parser_calls
+    icici_fails["value"] = False
+    assert excel_parser.parse_excel_file(CSV_BYTES, FILENAME) == [{"parser": "ICICI"}]
+    assert calls == ["ICICI"]
+
+
+def test_failing_parser_falls_through_to_next_match(parser_calls):
+    """A non-parse error from ICICI moves on to HDFC instead of dropping to the generic parser."""
+    calls, _icici_fails = parser_calls
+    assert excel_parser.parse_excel_file(CSV_BYTES, FILENAME) == [{"parser": "HDFC"}]
+    assert calls == ["ICICI", "HDFC"]
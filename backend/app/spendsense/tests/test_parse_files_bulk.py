@@ -0,0 +1,63 @@
+"""
+Unit tests for parsers.parse_files_bulk.
+
+Covers: input-order results, serial fallback inside worker processes and when no pool can start.
+"""
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import pytest
+
+from app.spendsense.etl import parsers
+
+INPUTS = [(b"a", "a.csv"), (b"b", "b.pdf"), (b"c", "c.xlsx")]
+EXPECTED = [[{"filename": "a.csv"}], [{"filename": "b.pdf"}], [{"filename": "c.xlsx"}]]
+
+
+def _fake_parse(data, filename, pdf_password=None):
+    return [{"filename": filename}]
+
+
+class _NoPool:
+    """Stands in for ProcessPoolExecutor in tests that must not start one."""
+
+    def __init__(self, *args, **kwargs):
+        raise AssertionError("ProcessPoolExecutor must not be created")
+
+
+class _FailingPool:
+    def __init__(self, *args, **kwargs):
+        raise OSError("no process slots")
+
+
+@pytest.fixture(autouse=True)
+def fake_parse(monkeypatch):
+    monkeypatch.setattr(parsers, "parse_transactions_file", _fake_parse)
+
+
+def test_serial_inside_worker_process(monkeypatch):
+    """In a daemon/pool worker (e.g. Celery prefork) no pool is started; results keep input order."""
+    monkeypatch.setattr(parsers, "_in_worker_process", lambda: True)
+    monkeypatch.setattr(parsers, "ProcessPoolExecutor", _NoPool)
+    assert parsers.parse_files_bulk(INPUTS, max_workers=4) == EXPECTED
+
+
+def test_serial_when_pool_cannot_start(monkeypatch):
+    """A pool that can't be created falls back to parsing serially, in input order."""
+    monkeypatch.setattr(parsers, "_in_worker_process", lambda: False)
+    monkeypatch.setattr(parsers, "ProcessPoolExecutor", _FailingPool)
+    assert parsers.parse_files_bulk(INPUTS, max_workers=4) == EXPECTED
+
+
+def test_single_worker_is_serial(monkeypatch):
+    monkeypatch.setattr(parsers, "ProcessPoolExecutor", _NoPool)
+    assert parsers.parse_files_bulk(INPUTS, max_workers=1) == EXPECTED
+    assert parsers.parse_files_bulk([]) == []
+
+
+def test_parallel_results_in_input_order(monkeypatch):
+    monkeypatch.setattr(parsers, "_in_worker_process", lambda: False)
+    assert parsers.parse_files_bulk(INPUTS, max_workers=2) == EXPECTED
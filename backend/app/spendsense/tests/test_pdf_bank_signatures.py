@@ -0,0 +1,44 @@
+"""
+Unit tests for pdf.BANK_SIGNATURES, the header check the PDF fallback loop uses to skip parsers.
+
+Covers: every fallback parser has its module's signature, each sample statement's header matches its own bank.
+"""
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import pytest
+
+from app.spendsense.etl.parsers import pdf, pdf_parser
+from app.spendsense.etl.parsers.pdf.detect import bank_hint
+
+SAMPLE_DIR = Path(__file__).resolve().parent.parent / "sample_bank/pdf"
+
+# Unencrypted samples only; the Axis and Federal ones need their statement passwords
+SAMPLES = [
+    ("HDFC", "HDFC statement .pdf"),
+    ("ICICI", "icici.pdf"),
+    ("Kotak", "kotak.pdf"),
+    ("SBI", "sbi.pdf"),
+    ("Canara", "canara_statement_2026-02-12 132319.569171.pdf"),
+]
+
+
+def test_every_fallback_parser_has_its_module_signature():
+    names = [name for name, _parser in pdf.BANK_PARSERS]
+    assert sorted(pdf.BANK_SIGNATURES) == sorted(names)
+    for name, parser in pdf.BANK_PARSERS:
+        module = sys.modules[parser.__module__]
+        assert pdf.BANK_SIGNATURES[name] is module.SIGNATURE
+
+
+@pytest.mark.parametrize("bank_name,filename", SAMPLES)
+def test_sample_header_matches_its_bank_signature(bank_name, filename):
+    path = SAMPLE_DIR / filename
+    if not path.exists():
+        pytest.skip(f"sample {filename} not available")
+    lines = pdf_parser._extract_lines(path.read_bytes())
+    assert lines
+    assert pdf.BANK_SIGNATURES[bank_name].search(bank_hint(lines))
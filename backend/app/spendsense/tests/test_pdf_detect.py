@@ -0,0 +1,47 @@
+"""
+Unit tests for the shared PDF bank-detection helpers in parsers.pdf.detect.
+
+Covers: header_text with and without a precomputed bank_hint, below/at/above HINT_LINES.
+"""
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import pytest
+
+from app.spendsense.etl.parsers.pdf.detect import HINT_LINES, bank_hint, header_text
+
+LINES = [f"Line {i} STATE Bank of India  Txn Date {i:03d}" for i in range(HINT_LINES + 40)]
+
+
+def _expected(lines, n):
+    return " ".join(lines[:n]).lower()
+
+
+@pytest.mark.parametrize("n", [0, 1, 50, HINT_LINES - 1, HINT_LINES, HINT_LINES + 1, HINT_LINES + 40])
+def test_header_text_matches_join(n):
+    """Slicing the shared hint gives exactly the joined, lowered window, whichever branch runs."""
+    assert header_text(LINES, n) == _expected(LINES, n)
+    assert header_text(LINES, n, bank_hint(LINES)) == _expected(LINES, n)
+
+
+@pytest.mark.parametrize("n", [1, 50, HINT_LINES, HINT_LINES + 1])
+def test_header_text_short_document(n):
+    """Fewer lines than the window (and than n)."""
+    lines = LINES[:30]
+    assert header_text(lines, n, bank_hint(lines)) == _expected(lines, n)
+
+
+@pytest.mark.parametrize("n", [1, 3, HINT_LINES])
+def test_header_text_when_lower_changes_length(n):
+    """U+0130 lowers to two characters, so the hint can't be sliced; the text is rebuilt instead."""
+    lines = ["İstanbul branch", "Kotak Mahindra Bank", "IFSC KKBK0000001"] + LINES
+    assert len(bank_hint(lines)) != len(" ".join(lines[:HINT_LINES]))
+    assert header_text(lines, n, bank_hint(lines)) == _expected(lines, n)
+
+
+def test_header_text_empty_lines():
+    assert header_text([], 10, bank_hint([])) == ""
+    assert header_text([], 10) == ""
@@ -0,0 +1,57 @@
+"""
+Unit tests for per-page PDF table extraction workers in parsers.pdf_parser.
+
+Covers: serial by default (opt-in only), serial inside worker processes, worker count bounds.
+"""
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import pytest
+
+from app.spendsense.etl.parsers import pdf_parser
+
+ICICI_PDF = Path(__file__).resolve().parent.parent / "sample_bank/pdf/icici.pdf"  # 5 pages, not encrypted
+
+
+def _no_parallel(*args, **kwargs):
+    raise AssertionError("page workers must not be started")
+
+
+@pytest.fixture
+def outside_workers(monkeypatch):
+    monkeypatch.setattr(pdf_parser, "_in_worker_process", lambda: False)
+    monkeypatch.setattr(pdf_parser.os, "cpu_count", lambda: 8)
+
+
+def test_serial_unless_requested(outside_workers):
+    assert pdf_parser._page_workers(20) == 1
+    assert pdf_parser._page_workers(20, 1) == 1
+
+
+def test_requested_workers_are_bounded(outside_workers):
+    assert pdf_parser._page_workers(20, 4) == 4
+    assert pdf_parser._page_workers(3, 4) == 3
+    assert pdf_parser._page_workers(50, 64) == min(pdf_parser.MAX_PAGE_WORKERS, 8)
+
+
+def test_serial_inside_worker_process(monkeypatch):
+    """Pool/daemon workers (e.g. Celery prefork) never start page pools, even when asked to."""
+    monkeypatch.setattr(pdf_parser, "_in_worker_process", lambda: True)
+    monkeypatch.setattr(pdf_parser.os, "cpu_count", lambda: 8)
+    assert pdf_parser._page_workers(20, 4) == 1
+
+
+@pytest.mark.skipif(not ICICI_PDF.exists(), reason="sample PDF not available")
+def test_extract_tables_is_serial_by_default(monkeypatch):
+    """A multi-page PDF is extracted in-process unless the caller opts in (fork is unsafe in threaded servers)."""
+    pytest.importorskip("pdfplumber")
+    monkeypatch.setattr(pdf_parser, "_best_page_rows_parallel", _no_parallel)
+    data = ICICI_PDF.read_bytes()
+    serial = pdf_parser._extract_pdf_tables(data)
+    assert not serial.empty
+
+    monkeypatch.setattr(pdf_parser, "_in_worker_process", lambda: True)
+    assert pdf_parser._extract_pdf_tables(data, page_workers=4).equals(serial)
@@ -0,0 +1,73 @@
+"""
+Unit tests for the in-memory result cache in parsers.pdf_parser.parse_pdf_file.
+
+Covers: cache hits return independent copies, password-specific keys, LRU bound.
+"""
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import pytest
+
+from app.spendsense.etl.parsers import pdf_parser
+
+PDF_BYTES = b"%PDF-1.4 statement bytes"
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Empty cache and a stub _parse_pdf_file that records its calls."""
+    calls = []
+
+    def fake_parse(data, filename, password=None, page_workers=1):
+        calls.append((data, filename, password))
+        return [{"description_raw": "UPI/CR/123", "amount": 100.0, "direction": "credit"}]
+
+    monkeypatch.setattr(pdf_parser, "_result_cache", OrderedDict())
+    monkeypatch.setattr(pdf_parser, "_parse_pdf_file", fake_parse)
+    return calls
+
+
+def test_cache_hit_returns_independent_copies(parse_calls):
+    """Second parse of the same upload is served from the cache; mutating a result never leaks."""
+    first = pdf_parser.parse_pdf_file(PDF_BYTES, "sbi.pdf")
+    first[0]["amount"] = -1.0
+    first.append({"amount": 0.0})
+
+    second = pdf_parser.parse_pdf_file(PDF_BYTES, "sbi.pdf")
+    assert len(parse_calls) == 1
+    assert second == [{"description_raw": "UPI/CR/123", "amount": 100.0, "direction": "credit"}]
+
+    second[0]["direction"] = "debit"
+    third = pdf_parser.parse_pdf_file(PDF_BYTES, "sbi.pdf")
+    assert len(parse_calls) == 1
+    assert third[0]["direction"] == "credit"
+    assert third[0] is not second[0]
+
+
+def test_cache_key_depends_on_password_without_storing_it(parse_calls):
+    """No password, an empty one and a real one are separate entries; keys hold only digests."""
+    pdf_parser.parse_pdf_file(PDF_BYTES, "sbi.pdf")
+    pdf_parser.parse_pdf_file(PDF_BYTES, "sbi.pdf", password="")
+    pdf_parser.parse_pdf_file(PDF_BYTES, "sbi.pdf", password="s3cret")
+    pdf_parser.parse_pdf_file(PDF_BYTES, "sbi.pdf", password="s3cret")
+    assert [call[2] for call in parse_calls] == [None, "", "s3cret"]
+
+    for digest, filename in pdf_parser._result_cache:
+        assert isinstance(digest, bytes) and len(digest) == 32
+        assert filename == "sbi.pdf"
+        assert b"s3cret" not in digest
+
+
+def test_cache_is_bounded(parse_calls, monkeypatch):
+    """Least recently used entries are evicted beyond _RESULT_CACHE_SIZE."""
+    monkeypatch.setattr(pdf_parser, "_RESULT_CACHE_SIZE", 2)
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        pdf_parser.parse_pdf_file(PDF_BYTES, name)
+    assert len(pdf_parser._result_cache) == 2
+
+    pdf_parser.parse_pdf_file(PDF_BYTES, "a.pdf")
+    assert len(parse_calls) == 4
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Test parsers against sample bank files in sample_bank/."""
 
+import argparse
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Reduce log noise
@@ -16,37 +19,62 @@ from app.spendsense.etl.parsers import parse_transactions_file
 SAMPLE_DIR = Path(__file__).parent.parent / "app/spendsense/sample_bank"
 
 
+def _parse_one(path: Path, page_workers: int = 1) -> tuple[str, str, int, str | None]:
+    """Parse one sample file; returns (name, kind, record count, error or None)."""
+    kind = "pdf" if path.suffix.lower() == ".pdf" else "excel"
+    try:
+        records = parse_transactions_file(path.read_bytes(), path.name, pdf_page_workers=page_workers)
+        return (path.name, kind, len(records), None)
+    except Exception as e:
+        return (path.name, kind, 0, str(e))
+
+
+def _print_results(results: list[tuple[str, str, int, str | None]]) -> None:
+    for name, _kind, count, error in results:
+        if error is None:
+            print(f"  {name}: {count} records - OK")
+        else:
+            print(f"  {name}: 0 records - FAIL")
+            print(f"    Error: {error}")
+
+
 def main():
-    results = []
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=os.cpu_count() or 1,
+        help="worker processes for parsing sample files (default: CPU count; 1 = serial)",
+    )
+    parser.add_argument(
+        "--page-workers", type=int, default=None,
+        help="with --jobs 1: worker processes per PDF for table extraction (default: CPU count)",
+    )
+    args = parser.parse_args()
+    # This script is single-threaded, so it may opt in to forked page workers when files run serially
+    page_workers = args.page_workers or os.cpu_count() or 1
+
+    excel_files = [f for f in sorted(SAMPLE_DIR.glob("excel/*")) if f.suffix.lower() in (".xls", ".xlsx", ".csv")]
+    pdf_files = [f for f in sorted(SAMPLE_DIR.glob("pdf/*")) if f.suffix.lower() == ".pdf"]
+
+    # Files are independent; parse them across processes and print in the original (sorted) order
+    if args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            excel_results = list(pool.map(_parse_one, excel_files))
+            pdf_results = list(pool.map(_parse_one, pdf_files))
+    else:
+        excel_results = [_parse_one(f) for f in excel_files]
+        pdf_results = [_parse_one(f, page_workers) for f in pdf_files]
+    results = excel_results + pdf_results
 
     print("=" * 60)
     print("EXCEL FILES")
     print("=" * 60)
-    for f in sorted(SAMPLE_DIR.glob("excel/*")):
-        if f.suffix.lower() in (".xls", ".xlsx", ".csv"):
-            try:
-                records = parse_transactions_file(f.read_bytes(), f.name)
-                results.append((f.name, "excel", len(records), None))
-                print(f"  {f.name}: {len(records)} records - OK")
-            except Exception as e:
-                results.append((f.name, "excel", 0, str(e)))
-                print(f"  {f.name}: 0 records - FAIL")
-                print(f"    Error: {e}")
+    _print_results(excel_results)
 
     print()
     print("=" * 60)
     print("PDF FILES")
     print("=" * 60)
-    for f in sorted(SAMPLE_DIR.glob("pdf/*")):
-        if f.suffix.lower() == ".pdf":
-            try:
-                records = parse_transactions_file(f.read_bytes(), f.name)
-                results.append((f.name, "pdf", len(records), None))
-                print(f"  {f.name}: {len(records)} records - OK")
-            except Exception as e:
-                results.append((f.name, "pdf", 0, str(e)))
-                print(f"  {f.name}: 0 records - FAIL")
-                print(f"    Error: {e}")
+    _print_results(pdf_results)
 
     print()
     print("=" * 60)